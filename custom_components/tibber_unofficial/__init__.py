@@ -3,29 +3,42 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 import logging
+import re
+from types import MappingProxyType
 from typing import Any
 
-import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.util import dt as dt_util
+from homeassistant.loader import async_get_integration
+from homeassistant.util import dt as dt_util, ssl as ssl_util
 
 from .api import ApiAuthError, ApiError, TibberApiClient
 from .const import (
+    API_FETCH_TIMEOUT,
+    CACHE_STATS_LOG_INTERVAL,
     CONF_EMAIL,
     CONF_GIZMO_IDS,
     CONF_HOME_ID,
     CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_TOKEN_EXPIRES_AT,
     COORDINATOR_GIZMOS,
+    COORDINATOR_GIZMOS_NAME,
     COORDINATOR_REWARDS,
+    COORDINATOR_REWARDS_NAME,
     DEFAULT_GIZMO_SCAN_INTERVAL,
+    DEFAULT_GIZMO_SCAN_INTERVAL_HOURS,
     DEFAULT_REWARDS_SCAN_INTERVAL,
+    DEFAULT_REWARDS_SCAN_INTERVAL_MINUTES,
     DESIRED_GIZMO_TYPES,
     DOMAIN,
     GRID_REWARDS_EV_CURRENT_DAY,
@@ -45,10 +58,54 @@ from .const import (
 )
 from .repairs import async_create_issue, async_delete_issue
 from .services import async_setup_services, async_unload_services
-from .storage import RateLimiterStorage
+from .storage import RateLimiterStorage, TokenStorage
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only result for a period whose fetch failed
+_EMPTY_REWARD: Mapping[str, Any] = MappingProxyType(
+    {
+        "ev": None,
+        "homevolt": None,
+        "total": None,
+        "currency": None,
+        "from_date_api": None,
+        "to_date_api": None,
+    }
+)
+
+# Sensor data keys for each reward period, in the order the coordinator
+# compiles them: (attribute prefix, EV key, Homevolt key, total key)
+_PERIOD_SPECS = (
+    (
+        "current_month",
+        GRID_REWARDS_EV_CURRENT_MONTH,
+        GRID_REWARDS_HOMEVOLT_CURRENT_MONTH,
+        GRID_REWARDS_TOTAL_CURRENT_MONTH,
+    ),
+    (
+        "previous_month",
+        GRID_REWARDS_EV_PREVIOUS_MONTH,
+        GRID_REWARDS_HOMEVOLT_PREVIOUS_MONTH,
+        GRID_REWARDS_TOTAL_PREVIOUS_MONTH,
+    ),
+    (
+        "year",
+        GRID_REWARDS_EV_YEAR,
+        GRID_REWARDS_HOMEVOLT_YEAR,
+        GRID_REWARDS_TOTAL_YEAR,
+    ),
+    (
+        "current_day",
+        GRID_REWARDS_EV_CURRENT_DAY,
+        GRID_REWARDS_HOMEVOLT_CURRENT_DAY,
+        GRID_REWARDS_TOTAL_CURRENT_DAY,
+    ),
+)
+
+# Matches API error messages caused by hitting the Tibber rate limit
+_RATE_LIMIT_RE = re.compile(r"rate limit|429", re.IGNORECASE)
+
 # Debug logging can be enabled in configuration.yaml:
 # logger:
 #   default: info
@@ -56,10 +113,34 @@ _LOGGER = logging.getLogger(__name__)
 #     custom_components.tibber_unofficial: debug
 
 
+@lru_cache(maxsize=8)
+def _month_bounds(year: int, month: int) -> tuple[str, str, str, str]:
+    """Return the UTC period boundaries for a month as ISO 8601 strings.
+
+    The values only change at month boundaries, so they are memoized along
+    with their string formatting.
+
+    Returns:
+        Tuple of (first day of the month, first day of the next month,
+        first day of the previous month, first day of the year)
+    """
+    first_day_current_month = datetime(year, month, 1, tzinfo=UTC)
+    first_day_next_month = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=UTC)
+    first_day_previous_month = datetime(
+        year - (month == 1), (month - 2) % 12 + 1, 1, tzinfo=UTC
+    )
+    first_day_current_year = datetime(year, 1, 1, tzinfo=UTC)
+    return (
+        first_day_current_month.isoformat(),
+        first_day_next_month.isoformat(),
+        first_day_previous_month.isoformat(),
+        first_day_current_year.isoformat(),
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Tibber Unofficial from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(entry.entry_id, {})
 
     email = entry.data[CONF_EMAIL]
     password = entry.data[CONF_PASSWORD]
@@ -71,81 +152,119 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         home_id[:8],
         entry.version,
     )
-    _LOGGER.debug(
-        "Configuration: email=%s, home_id=%s, gizmos=%s",
-        email,
-        home_id[:8],
-        list(initial_gizmo_ids.keys()) if initial_gizmo_ids else [],
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Configuration: email=%s, home_id=%s, gizmos=%s",
+            email,
+            home_id[:8],
+            list(initial_gizmo_ids.keys()) if initial_gizmo_ids else [],
+        )
+
+    # The config flow hands over its login token in the entry data; move it to
+    # the token storage so only one copy exists and it is kept current
+    token_storage = TokenStorage(hass, entry.entry_id)
+    if CONF_TOKEN in entry.data:
+        new_data = dict(entry.data)
+        token = new_data.pop(CONF_TOKEN)
+        if (expires_at := new_data.pop(CONF_TOKEN_EXPIRES_AT, None)) is not None:
+            await token_storage.async_save(token, expires_at, email)
+        hass.config_entries.async_update_entry(entry, data=new_data)
+
+    # Create a dedicated session with its own small keep-alive connection pool
+    session = TibberApiClient.build_session(
+        ssl=ssl_util.client_context(),
+        json_serialize=json_dumps,
     )
 
-    # Create a dedicated session with connection pooling and timeouts
-    timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
-    session = async_create_clientsession(hass, timeout=timeout)
+    async def _async_close_session(_event: Event) -> None:
+        """Close the dedicated session when Home Assistant shuts down."""
+        await session.close()
+
+    # A failed setup runs the unload callbacks, removing the shutdown listener,
+    # so the session must be closed here or it leaks on every retry
+    api_client: TibberApiClient | None = None
+    try:
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+        )
 
-    # Store session in hass.data for cleanup
-    hass.data[DOMAIN].setdefault("sessions", {})
-    hass.data[DOMAIN]["sessions"][entry.entry_id] = session
+        # Store session in hass.data for cleanup
+        hass.data[DOMAIN].setdefault("sessions", {})
+        hass.data[DOMAIN]["sessions"][entry.entry_id] = session
 
-    # Create storage for rate limiter persistence
-    rate_limiter_storage = RateLimiterStorage(hass, entry.entry_id)
+        # Create storage for rate limiter persistence
+        rate_limiter_storage = RateLimiterStorage(hass, entry.entry_id)
 
-    # Store session reference for cleanup
-    try:
+        integration = await async_get_integration(hass, DOMAIN)
         api_client = TibberApiClient(
             session=session,
             email=email,
             password=password,
             storage=rate_limiter_storage,
+            token_storage=token_storage,
+            version=str(integration.version),
         )
-        # Initialize rate limiter with stored state
+        # Initialize rate limiter and token with stored state
         await api_client.initialize()
-    except Exception:
-        await session.close()
-        raise
 
-    # Get update intervals from options or use defaults
-    rewards_interval_minutes = entry.options.get(
-        "rewards_scan_interval",
-        int(DEFAULT_REWARDS_SCAN_INTERVAL.total_seconds() / 60),
-    )
-    gizmo_interval_hours = entry.options.get(
-        "gizmo_scan_interval",
-        int(DEFAULT_GIZMO_SCAN_INTERVAL.total_seconds() / 3600),
-    )
+        # Get update intervals from options or use defaults
+        rewards_interval_minutes = entry.options.get(
+            "rewards_scan_interval",
+            DEFAULT_REWARDS_SCAN_INTERVAL_MINUTES,
+        )
+        gizmo_interval_hours = entry.options.get(
+            "gizmo_scan_interval",
+            DEFAULT_GIZMO_SCAN_INTERVAL_HOURS,
+        )
 
-    _LOGGER.debug(
-        "Initializing rewards coordinator (interval: %d minutes)",
-        rewards_interval_minutes,
-    )
-    rewards_coordinator = GridRewardsCoordinator(
-        hass,
-        api_client,
-        home_id,
-        update_interval=timedelta(minutes=rewards_interval_minutes),
-    )
-    await rewards_coordinator.async_config_entry_first_refresh()
-    _LOGGER.debug("Rewards coordinator initialized successfully")
+        _LOGGER.debug(
+            "Initializing rewards coordinator (interval: %d minutes)",
+            rewards_interval_minutes,
+        )
+        rewards_coordinator = GridRewardsCoordinator(
+            hass,
+            api_client,
+            home_id,
+            update_interval=timedelta(minutes=rewards_interval_minutes),
+        )
 
-    _LOGGER.debug(
-        "Initializing gizmo coordinator (interval: %d hours)",
-        gizmo_interval_hours,
-    )
-    gizmo_coordinator = GizmoUpdateCoordinator(
-        hass,
-        api_client,
-        home_id,
-        initial_gizmo_ids,
-        update_interval=timedelta(hours=gizmo_interval_hours),
-    )
-    await gizmo_coordinator.async_config_entry_first_refresh()
-    _LOGGER.debug("Gizmo coordinator initialized successfully")
-
-    hass.data[DOMAIN][entry.entry_id] = {
-        COORDINATOR_REWARDS: rewards_coordinator,
-        COORDINATOR_GIZMOS: gizmo_coordinator,
-        "api_client": api_client,
-        "session": session,
-    }
+        _LOGGER.debug(
+            "Initializing gizmo coordinator (interval: %d hours)",
+            gizmo_interval_hours,
+        )
+        gizmo_coordinator = GizmoUpdateCoordinator(
+            hass,
+            api_client,
+            home_id,
+            initial_gizmo_ids,
+            update_interval=timedelta(hours=gizmo_interval_hours),
+        )
+
+        # Both coordinators hit independent endpoints, so refresh them concurrently.
+        # Gizmos stored by the config flow already seed the gizmo coordinator.
+        # Let all refreshes finish before surfacing a failure so none is left running.
+        first_refreshes = [rewards_coordinator.async_config_entry_first_refresh()]
+        if gizmo_coordinator.data is None:
+            first_refreshes.append(gizmo_coordinator.async_config_entry_first_refresh())
+        results = await asyncio.gather(*first_refreshes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        _LOGGER.debug("Rewards and gizmo coordinators initialized successfully")
+
+        hass.data[DOMAIN][entry.entry_id] = {
+            COORDINATOR_REWARDS: rewards_coordinator,
+            COORDINATOR_GIZMOS: gizmo_coordinator,
+            "api_client": api_client,
+            "session": session,
+            "rate_limiter_storage": rate_limiter_storage,
+        }
+    except BaseException:
+        if api_client is not None:
+            await api_client.async_close()
+        await session.close()
+        hass.data[DOMAIN].get("sessions", {}).pop(entry.entry_id, None)
+        raise
 
     # Subscribe to options updates
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -154,43 +273,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Tibber Unofficial setup complete for %s", email)
     _LOGGER.debug("Entry ID: %s, Platforms loaded: %s", entry.entry_id, PLATFORMS)
 
-    # Log cache efficiency periodically
-    async def log_cache_stats() -> None:
-        """Log cache statistics periodically."""
-        try:
-            # Use shorter sleep intervals to respond quickly to cancellation
-            intervals_passed = 0
-            while entry.entry_id in hass.data.get(DOMAIN, {}):
-                # Sleep in 60 second intervals, check every minute
-                await asyncio.sleep(60)
-                intervals_passed += 1
-
-                # Only log stats every hour (60 intervals)
-                if intervals_passed >= 60:
-                    intervals_passed = 0
-                    if entry.entry_id in hass.data.get(DOMAIN, {}):
-                        stats = api_client.get_cache_stats()
-                        if stats["total_requests"] > 0:
-                            _LOGGER.info(
-                                "Cache stats: %d entries, %.1f%% hit rate (%d hits, %d misses)",
-                                stats["entries"],
-                                stats["hit_rate"],
-                                stats["hits"],
-                                stats["misses"],
-                            )
-                    else:
-                        break
-        except asyncio.CancelledError:
-            _LOGGER.debug("Cache stats task cancelled")
-            raise
-        except Exception:
-            pass  # Other exceptions during logging
+    # Log cache efficiency once an hour
+    @callback
+    def log_cache_stats(_now: datetime) -> None:
+        """Log cache statistics."""
+        stats = api_client.get_cache_stats()
+        if stats["total_requests"] > 0:
+            _LOGGER.info(
+                "Cache stats: %d entries, %.1f%% hit rate (%d hits, %d misses)",
+                stats["entries"],
+                stats["hit_rate"],
+                stats["hits"],
+                stats["misses"],
+            )
 
-    # Start cache stats logging task and store reference for cleanup
-    cache_task = hass.async_create_background_task(
-        log_cache_stats(), "tibber_unofficial_cache_stats"
+    # Schedule cache stats logging and store the cancel handle for cleanup
+    hass.data[DOMAIN][entry.entry_id]["cache_stats_cancel"] = async_track_time_interval(
+        hass, log_cache_stats, CACHE_STATS_LOG_INTERVAL
     )
-    hass.data[DOMAIN][entry.entry_id]["cache_task"] = cache_task
 
     # Setup services (only once for the domain)
     if not hass.services.has_service(DOMAIN, "refresh_rewards"):
@@ -213,11 +313,11 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         # Get new intervals from options
         rewards_interval_minutes = entry.options.get(
             "rewards_scan_interval",
-            int(DEFAULT_REWARDS_SCAN_INTERVAL.total_seconds() / 60),
+            DEFAULT_REWARDS_SCAN_INTERVAL_MINUTES,
         )
         gizmo_interval_hours = entry.options.get(
             "gizmo_scan_interval",
-            int(DEFAULT_GIZMO_SCAN_INTERVAL.total_seconds() / 3600),
+            DEFAULT_GIZMO_SCAN_INTERVAL_HOURS,
         )
 
         # Update coordinator intervals
@@ -247,6 +347,11 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored token when a config entry is deleted."""
+    await TokenStorage(hass, entry.entry_id).async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info(
@@ -257,19 +362,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         if entry.entry_id in hass.data[DOMAIN]:
-            # Cancel cache stats task
-            if "cache_task" in hass.data[DOMAIN][entry.entry_id]:
-                cache_task = hass.data[DOMAIN][entry.entry_id]["cache_task"]
-                if not cache_task.done():
-                    cache_task.cancel()
-                    try:
-                        await asyncio.wait_for(cache_task, timeout=1.0)
-                    except (TimeoutError, asyncio.CancelledError):
-                        pass
-                    except Exception as e:
-                        _LOGGER.debug("Error cancelling cache task: %s", e)
-
-            # Close the dedicated session
+            # Stop cache stats logging
+            cancel_cache_stats = hass.data[DOMAIN][entry.entry_id].pop(
+                "cache_stats_cancel", None
+            )
+            if cancel_cache_stats is not None:
+                cancel_cache_stats()
+
+            # Stop the client's background work, then close the dedicated session
+            await hass.data[DOMAIN][entry.entry_id]["api_client"].async_close()
             if "session" in hass.data[DOMAIN][entry.entry_id]:
                 session = hass.data[DOMAIN][entry.entry_id]["session"]
                 await session.close()
@@ -281,23 +382,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             ):
                 hass.data[DOMAIN]["sessions"].pop(entry.entry_id)
 
-            # Clean up rate limiter storage
-            try:
-                rate_limiter_storage = RateLimiterStorage(hass, entry.entry_id)
+            # Clean up rate limiter storage (best effort, errors are logged)
+            if "rate_limiter_storage" in hass.data[DOMAIN][entry.entry_id]:
+                rate_limiter_storage = hass.data[DOMAIN][entry.entry_id][
+                    "rate_limiter_storage"
+                ]
                 await rate_limiter_storage.async_remove()
-            except Exception:
-                pass  # Best effort cleanup
 
             hass.data[DOMAIN].pop(entry.entry_id)
             _LOGGER.debug("Entry data cleaned up successfully")
 
         # Unload services if this is the last entry
-        remaining_entries = [
-            e
-            for e in hass.data.get(DOMAIN, {})
-            if e != "sessions" and isinstance(hass.data[DOMAIN].get(e), dict)
-        ]
-        if not remaining_entries:
+        has_other_entries = any(
+            key != "sessions" and isinstance(value, dict)
+            for key, value in hass.data.get(DOMAIN, {}).items()
+        )
+        if not has_other_entries:
             await async_unload_services(hass)
     else:
         _LOGGER.warning("Failed to unload some platforms for entry %s", entry.entry_id)
@@ -318,116 +418,89 @@ class GridRewardsCoordinator(DataUpdateCoordinator):
         super().__init__(
             hass,
             _LOGGER,
-            name=f"{DOMAIN} Grid Rewards Data",
+            name=COORDINATOR_REWARDS_NAME,
             update_interval=update_interval or DEFAULT_REWARDS_SCAN_INTERVAL,
         )
         self.client = client
         self.home_id = home_id
+        self._has_cache_stats = hasattr(client, "get_cache_stats")
+        # Rewards for windows that have fully closed never change, keyed by
+        # their (from, to) dates. Grows by at most one entry per month.
+        self._period_cache: dict[tuple[str, str], Mapping[str, Any]] = {}
         _LOGGER.debug(
             "GridRewardsCoordinator initialized with interval: %s",
             self.update_interval,
         )
 
+    @callback
+    def async_clear_period_cache(self) -> None:
+        """Forget stored rewards for closed windows, refetching them next update."""
+        self._period_cache.clear()
+
     async def _fetch_reward_data_for_period(
         self,
         period_name: str,
-        from_date: datetime,
-        to_date: datetime,
-    ) -> dict[str, Any]:
-        from_date_str = from_date.isoformat()
-        to_date_str = to_date.isoformat()
-        _LOGGER.debug(
-            "Fetching %s rewards: %s to %s",
-            period_name,
-            from_date_str[:10],
-            to_date_str[:10],
-        )
+        from_date_str: str,
+        to_date_str: str,
+        *,
+        window_closed: bool = False,
+    ) -> Mapping[str, Any]:
+        key = (from_date_str, to_date_str)
+        if window_closed and (cached := self._period_cache.get(key)) is not None:
+            _LOGGER.debug("Using stored %s rewards for closed window", period_name)
+            return cached
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Fetching %s rewards: %s to %s",
+                period_name,
+                from_date_str[:10],
+                to_date_str[:10],
+            )
         try:
             # The API requires 'monthly' resolution - 'daily' is not supported
             # Monthly resolution still provides data for the date range specified
             use_daily_resolution = False
-            return await self.client.async_get_grid_rewards_history(
-                self.home_id,
-                from_date_str,
-                to_date_str,
-                use_daily_resolution=use_daily_resolution,
-            )
+            async with asyncio.timeout(API_FETCH_TIMEOUT):
+                data = await self.client.async_get_grid_rewards_history(
+                    self.home_id,
+                    from_date_str,
+                    to_date_str,
+                    use_daily_resolution=use_daily_resolution,
+                )
+        except ApiAuthError:
+            # Credentials won't recover by retrying; let the update fail so
+            # the reauth repair issue is raised
+            raise
         except Exception as e:
+            # Transient HTTP errors were already retried with backoff by the
+            # client, so give up on this period for the current refresh
             _LOGGER.warning(
                 "Failed to fetch %s rewards for home %s: %s",
                 period_name,
                 self.home_id[:8],
-                str(e),
+                e,
             )
             _LOGGER.debug("Full error details:", exc_info=True)
-            return {
-                "ev": None,
-                "homevolt": None,
-                "total": None,
-                "currency": None,
-                "from_date_api": None,
-                "to_date_api": None,
-            }
+            return _EMPTY_REWARD
+        if window_closed and data.get("total") is not None:
+            self._period_cache[key] = data
+        return data
 
     async def _async_update_data(self) -> dict[str, Any] | None:
-        _LOGGER.debug("Starting rewards data update for home %s", self.home_id[:8])
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Starting rewards data update for home %s", self.home_id[:8])
         try:
-            # Use Home Assistant's timezone-aware datetime
-            today_datetime = dt_util.now()
-
             # Calculate date ranges for current month, previous month, and year
-            # Ensure we're working in UTC for API calls
-            today_utc = today_datetime.astimezone(UTC)
-            first_day_current_month = today_utc.replace(
-                day=1,
-                hour=0,
-                minute=0,
-                second=0,
-                microsecond=0,
-            )
-            if today_utc.month == 12:
-                first_day_next_month = today_utc.replace(
-                    year=today_utc.year + 1,
-                    month=1,
-                    day=1,
-                    hour=0,
-                    minute=0,
-                    second=0,
-                    microsecond=0,
-                )
-            else:
-                first_day_next_month = today_utc.replace(
-                    month=today_utc.month + 1,
-                    day=1,
-                    hour=0,
-                    minute=0,
-                    second=0,
-                    microsecond=0,
-                )
-
-            last_day_previous_month_calc = first_day_current_month - timedelta(days=1)
-            first_day_previous_month = last_day_previous_month_calc.replace(
-                day=1,
-                hour=0,
-                minute=0,
-                second=0,
-                microsecond=0,
-            )
-            first_day_current_year = today_utc.replace(
-                month=1,
-                day=1,
-                hour=0,
-                minute=0,
-                second=0,
-                microsecond=0,
-            )
-
-            # Fetch data for all periods in parallel for better performance
+            # from a single clock read, in UTC for API calls
+            now = dt_util.utcnow()
             (
-                current_month_api_data,
-                previous_month_api_data,
-                year_api_data,
-            ) = await asyncio.gather(
+                first_day_current_month,
+                first_day_next_month,
+                first_day_previous_month,
+                first_day_current_year,
+            ) = _month_bounds(now.year, now.month)
+
+            period_fetches = [
                 self._fetch_reward_data_for_period(
                     "Current Month",
                     first_day_current_month,
@@ -437,68 +510,65 @@ class GridRewardsCoordinator(DataUpdateCoordinator):
                     "Previous Month",
                     first_day_previous_month,
                     first_day_current_month,
+                    window_closed=True,
                 ),
-                self._fetch_reward_data_for_period(
-                    "Year",
-                    first_day_current_year,
-                    first_day_next_month,
-                ),
-            )
+            ]
+            # The API returns a single aggregate per window, so the year total
+            # can't be split client-side. In January both windows are identical
+            # though, so the current month result doubles as the year result.
+            if first_day_current_year != first_day_current_month:
+                period_fetches.append(
+                    self._fetch_reward_data_for_period(
+                        "Year",
+                        first_day_current_year,
+                        first_day_next_month,
+                    ),
+                )
+
+            # Fetch data for all periods in parallel for better performance
+            results = await asyncio.gather(*period_fetches)
+            current_month_api_data, previous_month_api_data = results[0], results[1]
+            year_api_data = results[2] if len(results) > 2 else current_month_api_data
 
             # Since the API doesn't properly support daily resolution,
             # use current month data for current day sensors
             # This will show month-to-date values
             current_day_api_data = current_month_api_data
 
-            final_currency = (
-                current_month_api_data.get("currency")
-                or previous_month_api_data.get("currency")
-                or year_api_data.get("currency")
-                or current_day_api_data.get("currency")
-                or "N/A"
+            period_results = (
+                current_month_api_data,
+                previous_month_api_data,
+                year_api_data,
+                current_day_api_data,
             )
+            # Currency is home-scoped, so the client keeps the last one seen
+            final_currency = self.client.currency or "N/A"
 
-            compiled_data = {
-                GRID_REWARDS_EV_CURRENT_MONTH: current_month_api_data.get("ev"),
-                GRID_REWARDS_HOMEVOLT_CURRENT_MONTH: current_month_api_data.get(
-                    "homevolt",
-                ),
-                GRID_REWARDS_TOTAL_CURRENT_MONTH: current_month_api_data.get("total"),
-                "current_month_from": current_month_api_data.get("from_date_api"),
-                "current_month_to": current_month_api_data.get("to_date_api"),
-                GRID_REWARDS_EV_PREVIOUS_MONTH: previous_month_api_data.get("ev"),
-                GRID_REWARDS_HOMEVOLT_PREVIOUS_MONTH: previous_month_api_data.get(
-                    "homevolt",
-                ),
-                GRID_REWARDS_TOTAL_PREVIOUS_MONTH: previous_month_api_data.get("total"),
-                "previous_month_from": previous_month_api_data.get("from_date_api"),
-                "previous_month_to": previous_month_api_data.get("to_date_api"),
-                GRID_REWARDS_EV_YEAR: year_api_data.get("ev"),
-                GRID_REWARDS_HOMEVOLT_YEAR: year_api_data.get("homevolt"),
-                GRID_REWARDS_TOTAL_YEAR: year_api_data.get("total"),
-                "year_from": year_api_data.get("from_date_api"),
-                "year_to": year_api_data.get("to_date_api"),
-                GRID_REWARDS_EV_CURRENT_DAY: current_day_api_data.get("ev"),
-                GRID_REWARDS_HOMEVOLT_CURRENT_DAY: current_day_api_data.get("homevolt"),
-                GRID_REWARDS_TOTAL_CURRENT_DAY: current_day_api_data.get("total"),
-                "current_day_from": current_day_api_data.get("from_date_api"),
-                "current_day_to": current_day_api_data.get("to_date_api"),
-                KEY_CURRENCY: final_currency,
-            }
+            compiled_data: dict[str, Any] = {}
+            for (name, ev_key, homevolt_key, total_key), api_data in zip(
+                _PERIOD_SPECS, period_results, strict=True
+            ):
+                compiled_data[ev_key] = api_data.get("ev")
+                compiled_data[homevolt_key] = api_data.get("homevolt")
+                compiled_data[total_key] = api_data.get("total")
+                compiled_data[f"{name}_from"] = api_data.get("from_date_api")
+                compiled_data[f"{name}_to"] = api_data.get("to_date_api")
+            compiled_data[KEY_CURRENCY] = final_currency
             _LOGGER.info(
                 "Successfully updated rewards data - Currency: %s, Current month total: %s",
                 final_currency,
                 compiled_data.get(GRID_REWARDS_TOTAL_CURRENT_MONTH),
             )
-            _LOGGER.debug(
-                "Full rewards data: Current day: %s, Current month: %s, Year: %s",
-                compiled_data.get(GRID_REWARDS_TOTAL_CURRENT_DAY),
-                compiled_data.get(GRID_REWARDS_TOTAL_CURRENT_MONTH),
-                compiled_data.get(GRID_REWARDS_TOTAL_YEAR),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Full rewards data: Current day: %s, Current month: %s, Year: %s",
+                    compiled_data.get(GRID_REWARDS_TOTAL_CURRENT_DAY),
+                    compiled_data.get(GRID_REWARDS_TOTAL_CURRENT_MONTH),
+                    compiled_data.get(GRID_REWARDS_TOTAL_YEAR),
+                )
 
             # Log cache efficiency
-            if hasattr(self.client, "get_cache_stats"):
+            if self._has_cache_stats:
                 stats = self.client.get_cache_stats()
                 if stats["total_requests"] > 10:  # Only log after some requests
                     _LOGGER.debug(
@@ -508,7 +578,7 @@ class GridRewardsCoordinator(DataUpdateCoordinator):
 
             return compiled_data
         except ApiAuthError as err:
-            _LOGGER.error("Authentication failed during rewards update: %s", str(err))
+            _LOGGER.error("Authentication failed during rewards update: %s", err)
             # Create repair issue for authentication failure
             await async_create_issue(
                 self.hass,
@@ -527,9 +597,10 @@ class GridRewardsCoordinator(DataUpdateCoordinator):
                 "Authentication failed - Please reconfigure the integration",
             ) from err
         except ApiError as err:
-            _LOGGER.error("API error during rewards update: %s", str(err))
+            msg = str(err)
+            _LOGGER.error("API error during rewards update: %s", msg)
             # Check if it's a rate limit error
-            if "rate limit" in str(err).lower() or "429" in str(err):
+            if _RATE_LIMIT_RE.search(msg):
                 current_interval = int(self.update_interval.total_seconds() / 60)
                 await async_create_issue(
                     self.hass,
@@ -545,10 +616,11 @@ class GridRewardsCoordinator(DataUpdateCoordinator):
                         "current_interval_minutes": current_interval,
                     },
                 )
-            raise UpdateFailed(f"Failed to fetch rewards data: {err!s}") from err
+            raise UpdateFailed(f"Failed to fetch rewards data: {msg}") from err
         except Exception as err:
-            _LOGGER.exception("Unexpected error updating rewards data: %s", str(err))
-            raise UpdateFailed(f"Unexpected error: {err!s}") from err
+            msg = str(err)
+            _LOGGER.exception("Unexpected error updating rewards data: %s", msg)
+            raise UpdateFailed(f"Unexpected error: {msg}") from err
 
 
 class GizmoUpdateCoordinator(DataUpdateCoordinator):
@@ -566,27 +638,43 @@ class GizmoUpdateCoordinator(DataUpdateCoordinator):
         super().__init__(
             hass,
             _LOGGER,
-            name=f"{DOMAIN} Gizmo Data",
+            name=COORDINATOR_GIZMOS_NAME,
             update_interval=update_interval or DEFAULT_GIZMO_SCAN_INTERVAL,
         )
         self.client = client
         self.home_id = home_id
+        if initial_gizmos:
+            self.data = dict(initial_gizmos)
+        # Gizmos rarely change between scans; reuse the last grouping when the
+        # fetched (type, id) pairs are identical.
+        self._last_hash: int | None = None
+        self._last_result: dict[str, list[str]] | None = None
         _LOGGER.debug(
             "GizmoUpdateCoordinator initialized with interval: %s",
             self.update_interval,
         )
 
     async def _async_update_data(self) -> dict[str, list[str]]:
-        _LOGGER.debug("Starting gizmo data update for home %s", self.home_id[:8])
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Starting gizmo data update for home %s", self.home_id[:8])
         try:
-            gizmos_list = await self.client.async_get_gizmos(self.home_id)
-            gizmo_ids_by_type: dict[str, list[str]] = defaultdict(list)
-            if isinstance(gizmos_list, list):
-                for gizmo in gizmos_list:
-                    gizmo_type = gizmo.get("type")
-                    gizmo_id = gizmo.get("id")
-                    if gizmo_type in DESIRED_GIZMO_TYPES and gizmo_id:
-                        gizmo_ids_by_type[gizmo_type].append(gizmo_id)
+            async with asyncio.timeout(API_FETCH_TIMEOUT):
+                gizmos_list = await self.client.async_get_gizmos(self.home_id)
+            if not isinstance(gizmos_list, list):
+                gizmos_list = []
+            gizmos_hash = hash(
+                frozenset((g.get("type"), g.get("id")) for g in gizmos_list)
+            )
+            if gizmos_hash == self._last_hash and self._last_result is not None:
+                _LOGGER.debug("Gizmo data unchanged since last update")
+                return self._last_result
+
+            grouped: dict[str, list[str]] = {t: [] for t in DESIRED_GIZMO_TYPES}
+            for gizmo in gizmos_list:
+                ids = grouped.get(gizmo.get("type"))
+                if ids is not None and (gizmo_id := gizmo.get("id")):
+                    ids.append(gizmo_id)
+            gizmo_ids_by_type = {k: v for k, v in grouped.items() if v}
 
             _LOGGER.info(
                 "Successfully updated gizmo data - Found: %s",
@@ -594,10 +682,13 @@ class GizmoUpdateCoordinator(DataUpdateCoordinator):
                 if gizmo_ids_by_type
                 else "None",
             )
-            _LOGGER.debug("Gizmo details: %s", gizmo_ids_by_type)
-            return dict(gizmo_ids_by_type)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Gizmo details: %s", gizmo_ids_by_type)
+            self._last_hash = gizmos_hash
+            self._last_result = gizmo_ids_by_type
+            return gizmo_ids_by_type
         except ApiAuthError as err:
-            _LOGGER.error("Authentication failed during gizmo update: %s", str(err))
+            _LOGGER.error("Authentication failed during gizmo update: %s", err)
             # Create repair issue for authentication failure
             await async_create_issue(
                 self.hass,
@@ -616,8 +707,13 @@ class GizmoUpdateCoordinator(DataUpdateCoordinator):
                 "Authentication failed - Please reconfigure the integration",
             ) from err
         except ApiError as err:
-            _LOGGER.error("API error during gizmo update: %s", str(err))
-            raise UpdateFailed(f"Failed to fetch gizmo data: {err!s}") from err
+            msg = str(err)
+            _LOGGER.error("API error during gizmo update: %s", msg)
+            raise UpdateFailed(f"Failed to fetch gizmo data: {msg}") from err
+        except TimeoutError as err:
+            _LOGGER.error("Gizmo update timed out after %d seconds", API_FETCH_TIMEOUT)
+            raise UpdateFailed("Timed out fetching gizmo data") from err
         except Exception as err:
-            _LOGGER.exception("Unexpected error updating gizmo data: %s", str(err))
-            raise UpdateFailed(f"Unexpected error: {err!s}") from err
+            msg = str(err)
+            _LOGGER.exception("Unexpected error updating gizmo data: %s", msg)
+            raise UpdateFailed(f"Unexpected error: {msg}") from err
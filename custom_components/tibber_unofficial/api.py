@@ -4,32 +4,93 @@ from __future__ import annotations
 
 import asyncio
 from asyncio import sleep
-from datetime import UTC, datetime, timedelta
+import base64
+import binascii
+from collections.abc import Awaitable, Callable, Coroutine
+from datetime import UTC, datetime
+from functools import lru_cache
+import json
 import logging
 import random
-import re
+import time
 from typing import Any
 
 import aiohttp
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
 from .cache import SmartCache
 from .const import (
     API_AUTH_URL,
     API_GRAPHQL_URL,
+    DOMAIN,
     GIZMOS_QUERY_TEMPLATE,
     GRID_REWARDS_DAILY_QUERY_TEMPLATE,
     GRID_REWARDS_QUERY_TEMPLATE,
     HOMES_QUERY,
+    HOMES_WITH_GIZMOS_QUERY,
 )
 from .rate_limiter import MultiTierRateLimiter
 
 _LOGGER = logging.getLogger(__name__)
 
-# Compile UUID pattern once for performance
-UUID_PATTERN = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-    re.IGNORECASE,
-)
+# Maximum number of GraphQL requests in flight at once
+MAX_CONCURRENT_REQUESTS = 2
+
+# Token lifetime assumed after login when the token carries no exp claim
+TOKEN_LIFETIME = 3600.0
+# Tokens within this many seconds of expiry are treated as expired, leaving
+# headroom for long-running requests
+TOKEN_EXPIRY_BUFFER = 600.0
+# Tokens are refreshed in the background once they are this close to expiry,
+# ahead of the buffer that forces a blocking re-authentication
+PROACTIVE_TOKEN_REFRESH_WINDOW = 900.0
+
+# Bytes of an error response body kept for logs and error messages
+ERROR_BODY_LIMIT = 1024
+
+# Per-call timeouts, so requests behave the same on shared sessions
+_AUTH_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=10)
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=20, sock_connect=10)
+
+# Names of the known queries, for debug logging
+_QUERY_NAMES = {
+    HOMES_QUERY: "homes",
+    HOMES_WITH_GIZMOS_QUERY: "homes with gizmos",
+    GIZMOS_QUERY_TEMPLATE: "gizmos",
+    GRID_REWARDS_QUERY_TEMPLATE: "rewards",
+}
+
+# Exponential backoff factor per retry attempt (covers _max_retries)
+_BACKOFF_MULTIPLIERS = (1, 2, 4, 8, 16, 32)
+# Returned by a retry attempt that handled its own wait and wants another try
+_RETRY = object()
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _user_agent(version: str | None) -> str:
+    """Return the User-Agent identifying the integration and its release."""
+    product = f"{DOMAIN}/{version}" if version else DOMAIN
+    return f"{product} aiohttp/{aiohttp.__version__}"
+
+
+def _is_uuid(value: str) -> bool:
+    """Return True if value is a canonical 8-4-4-4-12 hex UUID string."""
+    if len(value) != 36:
+        return False
+    if not value[8] == value[13] == value[18] == value[23] == "-":
+        return False
+    digits = value.replace("-", "")
+    return len(digits) == 32 and _HEX_DIGITS.issuperset(digits)
+
 
 # Debug logging can be enabled in HA via:
 # logger:
@@ -38,21 +99,94 @@ UUID_PATTERN = re.compile(
 #     custom_components.tibber_unofficial: debug
 
 
+def _valid_gizmos(gizmos_list: list[Any]) -> list[dict[str, Any]]:
+    """Return the gizmos with a usable structure, warning about the rest."""
+    valid_gizmos = []
+    for gizmo in gizmos_list:
+        if isinstance(gizmo, dict) and gizmo.get("type"):
+            valid_gizmos.append(gizmo)
+        else:
+            _LOGGER.warning("Invalid gizmo data structure: %s", gizmo)
+    return valid_gizmos
+
+
+def _token_expires_at(token: str) -> float:
+    """Return the Unix time a JWT expires at, from its exp claim.
+
+    Falls back to TOKEN_LIFETIME from now if the token cannot be decoded.
+    """
+    try:
+        segment = token.split(".")[1]
+        claims = _json_loads(
+            base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+        )
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        _LOGGER.debug("Token has no readable exp claim, assuming default lifetime")
+        return time.time() + TOKEN_LIFETIME
+
+
+async def _read_error_body(response: aiohttp.ClientResponse, limit: int) -> str:
+    """Read at most limit bytes of an error response for logging."""
+    return (await response.content.read(limit)).decode(errors="replace")
+
+
+@lru_cache(maxsize=32)
+def _encode_payload(query: str, variables: tuple[tuple[str, Any], ...]) -> bytes:
+    """Encode a GraphQL request body, memoized for repeated queries."""
+    payload: dict[str, Any] = {"query": query}
+    if variables:
+        payload["variables"] = dict(variables)
+    return _json_dumps(payload)
+
+
 class ApiError(Exception):
     """Generic API error."""
 
-    pass
+    __slots__ = ()
 
 
 class ApiAuthError(ApiError):
     """API Authentication error."""
 
-    pass
+    __slots__ = ()
+
+
+class _Unauthorized(ApiError):
+    """A GraphQL request was rejected with 401; the token needs renewing."""
+
+    __slots__ = ()
 
 
 class TibberApiClient:
     """Client to interact with the Tibber API."""
 
+    __slots__ = (
+        "_auth_body",
+        "_auth_headers",
+        "_background_tasks",
+        "_base_delay",
+        "_cache",
+        "_cache_fallback",
+        "_currency",
+        "_email",
+        "_headers",
+        "_headers_token",
+        "_inflight",
+        "_initialized",
+        "_max_delay",
+        "_max_retries",
+        "_password",
+        "_rate_limiter",
+        "_refresh_task",
+        "_request_semaphore",
+        "_session",
+        "_token",
+        "_token_expiry_monotonic",
+        "_token_expiry_time",
+        "_token_storage",
+    )
+
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -60,6 +194,10 @@ class TibberApiClient:
         password: str | None = None,
         token: str | None = None,
         storage: Any = None,
+        *,
+        cache_fallback: bool = True,
+        token_storage: Any = None,
+        version: str | None = None,
     ):
         """Initialize the API client.
 
@@ -69,386 +207,509 @@ class TibberApiClient:
             password: User password
             token: Optional existing token
             storage: Optional storage for rate limiter persistence
+            cache_fallback: Serve last-known-good cached data on API errors
+            token_storage: Optional storage to persist the token across restarts
+            version: Integration version, reported in the User-Agent
         """
         self._session = session
         self._email = email
         self._password = password
+        # Credentials never change for a client, so encode the login body once
+        self._auth_body = _json_dumps({"email": email, "password": password})
+        # Identifies the integration on every request, whichever session is used
+        self._auth_headers = {
+            "Content-Type": "application/json",
+            "User-Agent": _user_agent(version),
+        }
         self._token = token
-        self._token_expiry_time: datetime | None = None
+        self._token_expiry_time: datetime | None = None  # For logs and diagnostics
+        self._token_expiry_monotonic: float | None = None
+        self._token_storage = token_storage
         self._max_retries = 3
         self._base_delay = 1.0  # Base delay in seconds for exponential backoff
         self._max_delay = 60.0  # Maximum delay between retries
-        self._jitter_range = 0.3  # Add ±30% jitter to delays
         self._rate_limiter = MultiTierRateLimiter(storage=storage)
         self._cache = SmartCache()
+        self._cache_fallback = cache_fallback
         self._initialized = False
-        self._auth_lock = asyncio.Lock()  # Prevent concurrent authentication
+        # In-flight authentication, shared by all callers needing a token
+        self._refresh_task: asyncio.Task[str] | None = None
+        self._headers: dict[str, str] = {}
+        self._headers_token: str | None = None
+        # Identical GraphQL requests in flight, keyed by query and variables
+        self._inflight: dict[tuple[str, tuple], asyncio.Task[dict[str, Any]]] = {}
+        # Background revalidations of stale cache entries
+        self._background_tasks: set[asyncio.Task[Any]] = set()
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._currency: str | None = None  # Home currency, learned from rewards
         # _LOGGER.debug("TibberApiClient initialized for email: %s", email) # Removed
 
+    @classmethod
+    def build_session(cls, **kwargs: Any) -> aiohttp.ClientSession:
+        """Create a session tuned for repeated requests to the Tibber API.
+
+        Connections are kept alive between coordinator polls so requests reuse
+        the TLS session, and cookies are ignored since auth uses bearer tokens.
+
+        Args:
+            **kwargs: Extra ClientSession arguments; ``ssl`` is passed to the
+                connector
+        """
+        connector = aiohttp.TCPConnector(
+            ssl=kwargs.pop("ssl", True),
+            limit=4,
+            limit_per_host=MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, sock_connect=10, sock_read=20),
+            cookie_jar=aiohttp.DummyCookieJar(),
+            **kwargs,
+        )
+
     async def initialize(self) -> None:
-        """Initialize rate limiter with stored state."""
+        """Initialize rate limiter and token with stored state."""
         if not self._initialized:
             await self._rate_limiter.initialize()
+            if self._token_storage and not self._token_valid():
+                await self._restore_token()
             self._initialized = True
 
+    async def async_close(self) -> None:
+        """Cancel background work so nothing outlives the session."""
+        tasks = [*self._background_tasks, *self._inflight.values()]
+        if self._refresh_task is not None:
+            tasks.append(self._refresh_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _restore_token(self) -> None:
+        """Reuse a stored token that is still valid, skipping a login."""
+        stored = await self._token_storage.async_load()
+        if stored is None:
+            return
+        token, expires_at, email = stored
+        if email != self._email:
+            # Credentials were changed since the token was stored
+            _LOGGER.debug("Stored token belongs to another account, ignoring it")
+            return
+        remaining = expires_at - time.time()
+        if remaining <= TOKEN_EXPIRY_BUFFER:
+            _LOGGER.debug("Stored token for %s is expired", self._email)
+            return
+        self._set_token(token, expires_at)
+        _LOGGER.debug(
+            "Restored stored token for %s (expires: %s)",
+            self._email,
+            self._token_expiry_time,
+        )
+
+    def _set_token(self, token: str, expires_at: float) -> None:
+        """Use token until expires_at, a POSIX timestamp."""
+        self._token = token
+        self._token_expiry_monotonic = time.monotonic() + (expires_at - time.time())
+        self._token_expiry_time = datetime.fromtimestamp(expires_at, UTC)
+
+    @property
+    def token_state(self) -> tuple[str, float] | None:
+        """Return the current token and its POSIX expiry, if any."""
+        if self._token and self._token_expiry_time is not None:
+            return self._token, self._token_expiry_time.timestamp()
+        return None
+
+    def _token_valid(self) -> bool:
+        """Return True if the token is usable without refreshing."""
+        # Check token with 10 minute buffer for long-running requests
+        return (
+            bool(self._token)
+            and self._token_expiry_monotonic is not None
+            and time.monotonic() < self._token_expiry_monotonic - TOKEN_EXPIRY_BUFFER
+        )
+
     async def _ensure_token(self) -> str:
         """Ensure a valid token is available, refreshing if necessary."""
-        # Check token with 10 minute buffer for long-running requests
-        if (
-            self._token
-            and self._token_expiry_time
-            and datetime.now(UTC) < self._token_expiry_time - timedelta(minutes=10)
-        ):
+        if self._token_valid():
             _LOGGER.debug(
                 "Using cached token for %s (expires: %s)",
                 self._email,
-                self._token_expiry_time.isoformat(),
+                self._token_expiry_time,
             )
-            return self._token
-
-        # Use lock to prevent concurrent authentication attempts
-        async with self._auth_lock:
-            # Check again after acquiring lock - another coroutine may have authenticated
-            if (
-                self._token
-                and self._token_expiry_time
-                and datetime.now(UTC) < self._token_expiry_time - timedelta(minutes=10)
-            ):
-                _LOGGER.debug(
-                    "Using token obtained by concurrent request for %s",
-                    self._email,
-                )
-                return self._token
+            self._schedule_proactive_refresh()
+            return self._token  # type: ignore[return-value]
 
+        # Join an authentication already in flight rather than starting another
+        if self._refresh_task is None:
             _LOGGER.info(
                 "Token is missing or expired for %s. Attempting to authenticate.",
                 self._email,
             )  # Kept info for this key event
-            if not self._email or not self._password:
-                _LOGGER.error("Email or password not provided for authentication.")
-                raise ApiAuthError(
-                    "Email and password are required to fetch a new token."
-                )
+        # Shield so one caller being cancelled doesn't abort the login for others
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Task[str]:
+        """Return the in-flight authentication task, starting one if needed."""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._authenticate())
+            self._refresh_task.add_done_callback(self._refresh_done)
+        return self._refresh_task
+
+    def _refresh_done(self, task: asyncio.Task[str]) -> None:
+        """Clear the finished authentication task and note background failures."""
+        self._refresh_task = None
+        if not task.cancelled() and (err := task.exception()) is not None:
+            # Callers waiting on the token raise it themselves; this only
+            # matters for proactive refreshes nobody was waiting on
+            _LOGGER.debug("Token refresh failed: %s", err)
+
+    def _schedule_proactive_refresh(self) -> None:
+        """Refresh the token in the background if it is close to expiring."""
+        if (
+            self._refresh_task is None
+            and self._password
+            and self._token_expiry_monotonic is not None
+            and time.monotonic()
+            >= self._token_expiry_monotonic - PROACTIVE_TOKEN_REFRESH_WINDOW
+        ):
+            _LOGGER.debug("Proactively refreshing token for %s", self._email)
+            self._start_refresh()
+
+    async def _authenticate(self) -> str:
+        """Authenticate and store a new token."""
+        if not self._email or not self._password:
+            _LOGGER.error("Email or password not provided for authentication.")
+            raise ApiAuthError("Email and password are required to fetch a new token.")
+
+        # Validate email format
+        if not isinstance(self._email, str) or "@" not in self._email:
+            raise ApiAuthError("Invalid email format")
+        if not isinstance(self._password, str) or not self._password:
+            raise ApiAuthError("Invalid password")
+
+        async def attempt(attempt: int) -> str:
+            _LOGGER.debug(
+                "Attempting authentication for %s (attempt %d/%d)",
+                self._email,
+                attempt + 1,
+                self._max_retries,
+            )
+            async with self._session.post(
+                API_AUTH_URL,
+                headers=self._auth_headers,
+                data=self._auth_body,
+                timeout=_AUTH_TIMEOUT,
+            ) as response:
+                if response.status in {400, 401}:
+                    _LOGGER.error(
+                        "Authentication failed for %s - Status: %s, Response: %s",
+                        self._email,
+                        response.status,
+                        await _read_error_body(response, 200),
+                    )  # Limit response text
+                    raise ApiAuthError(
+                        "Authentication failed: Invalid email or password",
+                    )
+                response.raise_for_status()
+                auth_data = await response.json(loads=_json_loads)
 
-            # Validate email format
-            if not isinstance(self._email, str) or "@" not in self._email:
-                raise ApiAuthError("Invalid email format")
-            if not isinstance(self._password, str) or not self._password:
-                raise ApiAuthError("Invalid password")
+            token = auth_data.get("token")
+            if not token:
+                _LOGGER.error(
+                    "Token not found in authentication response: %s",
+                    auth_data,
+                )
+                raise ApiAuthError("Token not received from API.")
 
-            auth_payload = {"email": self._email, "password": self._password}
-            headers = {"Content-Type": "application/json"}
+            # The expiry buffer in _token_valid keeps the usual safety margin
+            expires_at = _token_expires_at(token)
+            self._set_token(token, expires_at)
+            _LOGGER.info(
+                "Successfully authenticated %s - Token expires: %s",
+                self._email,
+                self._token_expiry_time.isoformat(),
+            )
+            _LOGGER.debug("Token obtained: %s...", token[:10])
+            if self._token_storage:
+                await self._token_storage.async_save(token, expires_at, self._email)
+            return token
 
-            # Retry authentication with exponential backoff
-            for attempt in range(self._max_retries):
-                try:
-                    _LOGGER.debug(
-                        "Attempting authentication for %s (attempt %d/%d)",
-                        self._email,
-                        attempt + 1,
-                        self._max_retries,
-                    )
-                    async with self._session.post(
-                        API_AUTH_URL,
-                        headers=headers,
-                        json=auth_payload,
-                        timeout=10,
-                    ) as response:
-                        if response.status in {400, 401}:
-                            responseText = await response.text()
-                            _LOGGER.error(
-                                "Authentication failed for %s - Status: %s, Response: %s",
-                                self._email,
-                                response.status,
-                                responseText[:200],
-                            )  # Limit response text
-                            raise ApiAuthError(
-                                "Authentication failed: Invalid email or password",
-                            )
-                        response.raise_for_status()
-                        auth_data = await response.json()
-                        # _LOGGER.debug("Authentication response data: %s", auth_data) # Removed
-
-                        self._token = auth_data.get("token")
-                        if not self._token:
-                            _LOGGER.error(
-                                "Token not found in authentication response: %s",
-                                auth_data,
-                            )
-                            raise ApiAuthError("Token not received from API.")
-
-                        self._token_expiry_time = datetime.now(UTC) + timedelta(
-                            hours=1,
-                        )
-                        _LOGGER.info(
-                            "Successfully authenticated %s - Token expires: %s",
-                            self._email,
-                            self._token_expiry_time.isoformat(),
-                        )
-                        _LOGGER.debug(
-                            "Token obtained: %s...",
-                            self._token[:10] if self._token else "None",
-                        )
-                        return self._token
-                except (TimeoutError, aiohttp.ClientError) as e:
-                    if attempt < self._max_retries - 1:
-                        # Exponential backoff with jitter for auth retries
-                        base_wait = min(
-                            self._base_delay * (2**attempt), self._max_delay
-                        )
-                        jitter = (
-                            base_wait * self._jitter_range * (2 * random.random() - 1)
-                        )
-                        wait_time = max(0.1, base_wait + jitter)
-                        _LOGGER.warning(
-                            "Authentication network error: %s. Retrying in %.2f seconds (attempt %s/%s)",
-                            e,
-                            wait_time,
-                            attempt + 1,
-                            self._max_retries,
-                        )
-                        await sleep(wait_time)
-                    else:
-                        _LOGGER.error(
-                            "Error during authentication after %s retries: %s",
-                            self._max_retries,
-                            e,
-                        )
-                        raise ApiError(f"Error during authentication: {e}") from e
-                except ApiAuthError:
-                    raise  # Don't retry on auth errors (bad credentials)
-                except Exception as e:
-                    _LOGGER.exception("Unexpected error during authentication.")
-                    raise ApiError(
-                        f"Unexpected error during authentication: {e}"
-                    ) from e
-
-            # Should not reach here
-            raise ApiError("Authentication failed after all retries")
+        # Bad credentials raise ApiAuthError and are not retried
+        return await self._retry("Authentication", attempt)
 
     async def authenticate(self) -> None:
         """Explicitly authenticate and get a token (used by config flow)."""
         await self._ensure_token()
 
+    def _backoff(self, attempt: int) -> float:
+        """Return a retry delay using exponential backoff with full jitter."""
+        base = min(self._base_delay * _BACKOFF_MULTIPLIERS[attempt], self._max_delay)
+        return max(0.1, random.uniform(0, base))
+
+    async def _retry(
+        self,
+        op_name: str,
+        attempt_fn: Callable[[int], Awaitable[Any]],
+        retry_on: tuple[type[Exception], ...] = (TimeoutError, aiohttp.ClientError),
+    ) -> Any:
+        """Run attempt_fn with exponential backoff on transient errors.
+
+        attempt_fn receives the zero-based attempt number. It may return
+        _RETRY after handling a retryable response itself (e.g. waiting out
+        a 429) to move on to the next attempt.
+        """
+        for attempt in range(self._max_retries):
+            try:
+                result = await attempt_fn(attempt)
+            except ApiError:
+                raise  # Don't retry on API errors (like auth errors)
+            except retry_on as e:
+                detail = str(e) or type(e).__name__
+                if attempt == self._max_retries - 1:
+                    _LOGGER.error(
+                        "%s failed after %d retries: %s",
+                        op_name,
+                        self._max_retries,
+                        detail,
+                    )
+                    raise ApiError(f"{op_name} failed: {detail}") from e
+                wait_time = self._backoff(attempt)
+                _LOGGER.warning(
+                    "%s error (%s: %s) - Retrying in %.2f seconds (attempt %d/%d)",
+                    op_name,
+                    type(e).__name__,
+                    detail,
+                    wait_time,
+                    attempt + 1,
+                    self._max_retries,
+                )
+                await sleep(wait_time)
+            except Exception as e:
+                _LOGGER.exception("Unexpected error during %s.", op_name)
+                raise ApiError(f"Unexpected error during {op_name}: {e}") from e
+            else:
+                if result is not _RETRY:
+                    return result
+
+        raise ApiError(f"{op_name} failed after {self._max_retries} retries")
+
+    def _request_headers(self, token: str) -> dict[str, str]:
+        """Return GraphQL request headers, rebuilt only when the token changes."""
+        if self._headers_token != token:
+            self._headers = {**self._auth_headers, "Authorization": f"Bearer {token}"}
+            self._headers_token = token
+        return self._headers
+
     async def _graphql_request(
         self,
         query: str,
         variables: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make a GraphQL request, sharing identical requests already in flight."""
+        key = (query, tuple(sorted(variables.items())) if variables else ())
+        task = self._inflight.get(key)
+        if task is None:
+
+            def _done(task: asyncio.Task[dict[str, Any]]) -> None:
+                self._inflight.pop(key, None)
+                # Waiters raise the error themselves; retrieve it here too in
+                # case every waiter was cancelled first
+                if not task.cancelled():
+                    task.exception()
+
+            task = asyncio.create_task(self._execute_graphql_request(query, variables))
+            self._inflight[key] = task
+            task.add_done_callback(_done)
+        else:
+            _LOGGER.debug("Joining identical GraphQL request already in flight")
+        # Shield so one caller being cancelled doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _execute_graphql_request(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Make a GraphQL request to the Tibber API with retry logic."""
         # Ensure rate limiter is initialized
         if not self._initialized:
             await self.initialize()
 
-        query_type = query.split("{")[0].strip() if "{" in query else "Unknown"
-        _LOGGER.debug("GraphQL request: %s, Variables: %s", query_type, variables)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            query_type = _QUERY_NAMES.get(query) or query.split("{", 1)[0].strip()
+            _LOGGER.debug("GraphQL request: %s, Variables: %s", query_type, variables)
 
         # Apply rate limiting before making the request
         await self._rate_limiter.acquire()
         _LOGGER.debug("Rate limit acquired for request")
 
-        last_exception = None
+        body = _encode_payload(
+            query, tuple(sorted(variables.items())) if variables else ()
+        )
 
-        for attempt in range(self._max_retries):
-            try:
-                token = await self._ensure_token()
-                headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {token}",
-                }
-                payload: dict[str, Any] = {"query": query}
-                if variables:
-                    payload["variables"] = variables
+        return await self._retry(
+            "GraphQL request",
+            lambda attempt: self._graphql_attempt(body, attempt),
+        )
 
-                _LOGGER.debug(
-                    "Sending request (attempt %d/%d) to %s",
-                    attempt + 1,
-                    self._max_retries,
-                    API_GRAPHQL_URL,
-                )
+    async def _post_graphql(
+        self, token: str, body: bytes
+    ) -> tuple[int, Any, str | None]:
+        """POST one GraphQL request.
 
-                async with self._session.post(
-                    API_GRAPHQL_URL,
-                    headers=headers,
-                    json=payload,
-                    timeout=20,
-                ) as response:
-                    # _LOGGER.debug("GraphQL raw response status: %s", response.status) # Removed
-                    _LOGGER.debug("Response status: %s", response.status)
-                    if response.status >= 400:
-                        raw_response_text_error = await response.text()
-                        _LOGGER.warning(
-                            "GraphQL request failed - Status: %s, Response: %s",
-                            response.status,
-                            raw_response_text_error[:500],
-                        )  # Limit log size
-
-                    if response.status == 401:  # Unauthorized
-                        _LOGGER.warning(
-                            "Token expired or invalid (401) - Re-authenticating %s",
-                            self._email,
-                        )
-                        self._token = None
-                        self._token_expiry_time = None
-                        token = await self._ensure_token()
-                        headers["Authorization"] = f"Bearer {token}"
-                        _LOGGER.debug("Retrying request with new token")
-                        async with self._session.post(
-                            API_GRAPHQL_URL,
-                            headers=headers,
-                            json=payload,
-                            timeout=20,
-                        ) as retry_response:
-                            # _LOGGER.debug("GraphQL retry raw response status: %s", retry_response.status) # Removed
-                            if retry_response.status >= 400:
-                                raw_retry_response_text_error = (
-                                    await retry_response.text()
-                                )
-                                _LOGGER.warning(
-                                    "GraphQL retry request failed with status %s. Body: %s",
-                                    retry_response.status,
-                                    raw_retry_response_text_error,
-                                )
-                            retry_response.raise_for_status()
-                            data = await retry_response.json()
-                    elif response.status == 429:  # Rate limited
-                        retry_after = response.headers.get("Retry-After")
-                        if retry_after:
-                            wait_time = float(retry_after)
-                        else:
-                            # Exponential backoff with jitter
-                            base_wait = min(
-                                self._base_delay * (2**attempt),
-                                self._max_delay,
-                            )
-                            jitter = (
-                                base_wait
-                                * self._jitter_range
-                                * (2 * random.random() - 1)
-                            )
-                            wait_time = base_wait + jitter
-                        _LOGGER.warning(
-                            "Rate limited (429). Waiting %.2f seconds before retry %s/%s",
-                            wait_time,
-                            attempt + 1,
-                            self._max_retries,
-                        )
-                        await sleep(wait_time)
-                        continue
-                    elif (
-                        response.status >= 500
-                    ):  # Server errors - retry with exponential backoff
-                        if attempt < self._max_retries - 1:
-                            # Exponential backoff with jitter and maximum delay
-                            base_wait = min(
-                                self._base_delay * (2**attempt),
-                                self._max_delay,
-                            )
-                            jitter = (
-                                base_wait
-                                * self._jitter_range
-                                * (2 * random.random() - 1)
-                            )
-                            wait_time = base_wait + jitter
-                            _LOGGER.warning(
-                                "Server error (%s). Retrying in %.2f seconds (attempt %s/%s)",
-                                response.status,
-                                wait_time,
-                                attempt + 1,
-                                self._max_retries,
-                            )
-                            await sleep(wait_time)
-                            continue
-                        else:
-                            response.raise_for_status()
-                    else:
-                        response.raise_for_status()
-                        data = await response.json()
-
-                    if data.get("errors"):
-                        error_msgs = [
-                            err.get("message", str(err)) for err in data["errors"]
-                        ]
-                        _LOGGER.error(
-                            "GraphQL errors returned: %s",
-                            ", ".join(error_msgs),
-                        )
-                        raise ApiError(f"GraphQL query failed: {', '.join(error_msgs)}")
-
-                    _LOGGER.debug("GraphQL request successful")
-                    return data.get("data", {})
-
-            except TimeoutError as e:
-                last_exception = e
-                if attempt < self._max_retries - 1:
-                    base_wait = min(self._base_delay * (2**attempt), self._max_delay)
-                    jitter = base_wait * self._jitter_range * (2 * random.random() - 1)
-                    wait_time = max(0.1, base_wait + jitter)
-                    _LOGGER.warning(
-                        "Request timeout after 20s - Retrying in %.2f seconds (attempt %d/%d)",
-                        wait_time,
-                        attempt + 1,
-                        self._max_retries,
-                    )
-                    await sleep(wait_time)
-                else:
-                    _LOGGER.error(
-                        "Request timeout after %d retries - Network may be slow or API unresponsive",
-                        self._max_retries,
-                    )
-                    raise ApiError(
-                        "Request timed out - Please check your network connection",
-                    ) from e
-            except aiohttp.ClientError as e:
-                last_exception = e
-                if attempt < self._max_retries - 1:
-                    base_wait = min(self._base_delay * (2**attempt), self._max_delay)
-                    jitter = base_wait * self._jitter_range * (2 * random.random() - 1)
-                    wait_time = max(0.1, base_wait + jitter)
-                    error_type = type(e).__name__
-                    _LOGGER.warning(
-                        "Network error (%s: %s) - Retrying in %.2f seconds (attempt %d/%d)",
-                        error_type,
-                        str(e),
-                        wait_time,
-                        attempt + 1,
-                        self._max_retries,
-                    )
-                    await sleep(wait_time)
-                else:
-                    _LOGGER.error(
-                        "Network error after %d retries: %s",
-                        self._max_retries,
-                        str(e),
-                    )
-                    raise ApiError(f"Network connection failed: {e!s}") from e
-            except ApiError:
-                raise  # Don't retry on API errors (like auth errors)
-            except Exception as e:
-                _LOGGER.exception(
-                    "Unexpected error during GraphQL request execution or parsing.",
+        Returns the status, the decoded JSON (or a bounded prefix of the error
+        body for status >= 400) and any Retry-After header. Raises
+        _Unauthorized on 401 so the common path carries no re-login branch.
+        """
+        # Cap concurrent requests so gathered coordinator fetches do not burst
+        # past the upstream limit; the slot is only held for the HTTP exchange,
+        # never across re-logins or retry waits
+        async with (
+            self._request_semaphore,
+            self._session.post(
+                API_GRAPHQL_URL,
+                headers=self._request_headers(token),
+                data=body,
+                timeout=_REQUEST_TIMEOUT,
+            ) as response,
+        ):
+            _LOGGER.debug("Response status: %s", response.status)
+            self._rate_limiter.update_from_headers(response.headers)
+            if response.status >= 400:
+                # Read a bounded prefix once, for both the log and the error
+                error_body = await _read_error_body(response, ERROR_BODY_LIMIT)
+                _LOGGER.warning(
+                    "GraphQL request failed - Status: %s, Response: %s",
+                    response.status,
+                    error_body,
                 )
-                raise ApiError(
-                    f"An unexpected error occurred during GraphQL request: {e}",
-                ) from e
+                if response.status == 401:
+                    raise _Unauthorized(f"HTTP 401: {error_body}")
+                return response.status, error_body, response.headers.get("Retry-After")
+            return response.status, await response.json(loads=_json_loads), None
+
+    async def _graphql_attempt(self, body: bytes, attempt: int) -> Any:
+        """Send one GraphQL request, handling status-specific retries inline."""
+        # Only await the token when it actually needs refreshing
+        if self._token_valid():
+            self._schedule_proactive_refresh()
+            token: str = self._token  # type: ignore[assignment]
+        else:
+            token = await self._ensure_token()
 
-        # If we get here, all retries failed
-        if last_exception:
-            raise ApiError(
-                f"Failed after {self._max_retries} retries: {last_exception}",
-            ) from last_exception
-        raise ApiError(f"Failed after {self._max_retries} retries")
+        _LOGGER.debug(
+            "Sending request (attempt %d/%d) to %s",
+            attempt + 1,
+            self._max_retries,
+            API_GRAPHQL_URL,
+        )
+        try:
+            status, payload, retry_after = await self._post_graphql(token, body)
+        except _Unauthorized:
+            _LOGGER.warning(
+                "Token expired or invalid (401) - Re-authenticating %s",
+                self._email,
+            )
+            self._token = None
+            self._token_expiry_time = None
+            self._token_expiry_monotonic = None
+            _LOGGER.debug("Retrying request with new token")
+            # A second 401 propagates as an ApiError
+            status, payload, retry_after = await self._post_graphql(
+                await self._ensure_token(), body
+            )
+
+        if status == 429:  # Rate limited
+            if attempt == self._max_retries - 1:
+                raise ApiError(f"Rate limited (429) after {self._max_retries} retries")
+            try:
+                # Bound the server's wait so one response cannot stall the client
+                wait_time = min(float(retry_after), self._max_delay)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                # Missing or in HTTP-date form
+                wait_time = self._backoff(attempt)
+            _LOGGER.warning(
+                "Rate limited (429). Waiting %.2f seconds before retry %s/%s",
+                wait_time,
+                attempt + 1,
+                self._max_retries,
+            )
+            await sleep(wait_time)
+            return _RETRY
+        if status >= 500:  # Server errors - retry with backoff
+            if attempt < self._max_retries - 1:
+                wait_time = self._backoff(attempt)
+                _LOGGER.warning(
+                    "Server error (%s). Retrying in %.2f seconds (attempt %s/%s)",
+                    status,
+                    wait_time,
+                    attempt + 1,
+                    self._max_retries,
+                )
+                await sleep(wait_time)
+                return _RETRY
+            raise ApiError(f"HTTP {status}: {payload}")
+        if status >= 400:
+            # Other client errors won't succeed on retry
+            raise ApiError(f"HTTP {status}: {payload}")
+
+        data = payload
+        if errors := data.get("errors"):
+            error_text = ", ".join(err.get("message") or str(err) for err in errors)
+            _LOGGER.error("GraphQL errors returned: %s", error_text)
+            raise ApiError(f"GraphQL query failed: {error_text}")
+
+        _LOGGER.debug("GraphQL request successful")
+        return data.get("data", {})
+
+    def _revalidate(self, coro: Coroutine[Any, Any, Any], what: str) -> None:
+        """Refresh a stale cache entry in the background."""
+
+        def _done(task: asyncio.Task[Any]) -> None:
+            self._background_tasks.discard(task)
+            if not task.cancelled() and (err := task.exception()) is not None:
+                _LOGGER.debug("Background refresh of %s failed: %s", what, err)
+
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(_done)
+
+    def _stale_or_raise(self, err: ApiError, method: str, **kwargs: Any) -> Any:
+        """Return last-known-good cached data for a failed request, else re-raise."""
+        if (
+            self._cache_fallback
+            and (stale := self._cache.get_stale(method, **kwargs)) is not None
+        ):
+            _LOGGER.warning("Using cached %s data after API error: %s", method, err)
+            return stale
+        raise err
 
     async def async_get_homes(self) -> list[dict[str, Any]]:
         """Fetch user's homes using GraphQL."""
         _LOGGER.debug("Fetching homes for user %s", self._email)
 
-        # Check cache first
-        cached_homes = self._cache.get("get_homes", email=self._email)
-        if cached_homes is not None:
+        # Check cache first, refreshing stale entries in the background
+        cached_homes, status = self._cache.get_with_status(
+            "get_homes", self._cache.stale_config["homes"], email=self._email
+        )
+        if status == "fresh":
             _LOGGER.debug("Using cached homes data")
             return cached_homes
+        if status == "stale":
+            _LOGGER.debug("Using stale homes data while refreshing")
+            self._revalidate(self._fetch_homes(), "homes")
+            return cached_homes
+
+        try:
+            return await self._fetch_homes()
+        except ApiAuthError:
+            raise
+        except ApiError as err:
+            return self._stale_or_raise(err, "get_homes", email=self._email)
 
+    async def _fetch_homes(self) -> list[dict[str, Any]]:
+        """Fetch homes from the API and cache them."""
         try:
             response_data_field = await self._graphql_request(query=HOMES_QUERY)
             homes_list = response_data_field.get("me", {}).get("homes", [])
@@ -465,13 +726,14 @@ class TibberApiClient:
                     _LOGGER.warning("Invalid home data structure: %s", home)
 
             _LOGGER.info("Found %d valid homes for %s", len(valid_homes), self._email)
-            _LOGGER.debug(
-                "Homes: %s",
-                [
-                    {"id": h.get("id"), "name": h.get("appNickname")}
-                    for h in valid_homes
-                ],
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Homes: %s",
+                    [
+                        {"id": h.get("id"), "deal": h.get("hasSignedEnergyDeal")}
+                        for h in valid_homes
+                    ],
+                )
 
             # Cache the homes data
             self._cache.set_smart("get_homes", valid_homes, "homes", email=self._email)
@@ -494,7 +756,7 @@ class TibberApiClient:
             raise ApiError("Invalid home_id - Must be a non-empty string")
 
         # Validate UUID format
-        if not UUID_PATTERN.match(home_id):
+        if not _is_uuid(home_id):
             _LOGGER.error("Invalid home_id format (not UUID): %s", home_id[:8])
             raise ApiError("Invalid home_id - Must be a valid UUID")
 
@@ -503,12 +765,27 @@ class TibberApiClient:
             home_id[:8],
         )  # Log partial ID for privacy
 
-        # Check cache first
-        cached_gizmos = self._cache.get("get_gizmos", home_id=home_id)
-        if cached_gizmos is not None:
+        # Check cache first, refreshing stale entries in the background
+        cached_gizmos, status = self._cache.get_with_status(
+            "get_gizmos", self._cache.stale_config["gizmos"], home_id=home_id
+        )
+        if status == "fresh":
             _LOGGER.debug("Using cached gizmos data")
             return cached_gizmos
+        if status == "stale":
+            _LOGGER.debug("Using stale gizmos data while refreshing")
+            self._revalidate(self._fetch_gizmos(home_id), "gizmos")
+            return cached_gizmos
+
+        try:
+            return await self._fetch_gizmos(home_id)
+        except ApiAuthError:
+            raise
+        except ApiError as err:
+            return self._stale_or_raise(err, "get_gizmos", home_id=home_id)
 
+    async def _fetch_gizmos(self, home_id: str) -> list[dict[str, Any]]:
+        """Fetch gizmos for a home from the API and cache them."""
         variables = {"homeId": home_id}
         try:
             response_data_field = await self._graphql_request(
@@ -525,29 +802,24 @@ class TibberApiClient:
                 )
                 return []
 
-            # Validate gizmo data structure
-            valid_gizmos = []
-            for gizmo in gizmos_list:
-                if isinstance(gizmo, dict) and gizmo.get("type"):
-                    valid_gizmos.append(gizmo)
-                else:
-                    _LOGGER.warning("Invalid gizmo data structure: %s", gizmo)
+            valid_gizmos = _valid_gizmos(gizmos_list)
 
             _LOGGER.info(
                 "Found %d valid gizmos for home %s",
                 len(valid_gizmos),
                 home_id[:8],
             )
-            _LOGGER.debug(
-                "Gizmos: %s",
-                [
-                    {
-                        "type": g.get("type"),
-                        "id": g.get("id")[:8] if g.get("id") else None,  # type: ignore[index]
-                    }
-                    for g in valid_gizmos
-                ],
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Gizmos: %s",
+                    [
+                        {
+                            "type": g.get("type"),
+                            "id": g.get("id")[:8] if g.get("id") else None,  # type: ignore[index]
+                        }
+                        for g in valid_gizmos
+                    ],
+                )
 
             # Cache the gizmos data
             self._cache.set_smart("get_gizmos", valid_gizmos, "gizmos", home_id=home_id)
@@ -562,6 +834,49 @@ class TibberApiClient:
             )
             raise ApiError(f"Failed to fetch gizmos: {e!s}") from e
 
+    async def async_get_homes_with_gizmos(self) -> list[dict[str, Any]]:
+        """Fetch user's homes together with their gizmos in one request.
+
+        Each home carries its validated gizmos under "gizmos". Homes and
+        per-home gizmos are cached as if they had been fetched separately.
+        """
+        _LOGGER.debug("Fetching homes with gizmos for user %s", self._email)
+        try:
+            response_data_field = await self._graphql_request(
+                query=HOMES_WITH_GIZMOS_QUERY
+            )
+            homes_list = response_data_field.get("me", {}).get("homes", [])
+            if not isinstance(homes_list, list):
+                _LOGGER.error("API response for homes is not a list.")
+                return []
+
+            valid_homes = []
+            for home in homes_list:
+                if not (isinstance(home, dict) and home.get("id")):
+                    _LOGGER.warning("Invalid home data structure: %s", home)
+                    continue
+                gizmos_list = home.get("gizmos")
+                home["gizmos"] = (
+                    _valid_gizmos(gizmos_list) if isinstance(gizmos_list, list) else []
+                )
+                self._cache.set_smart(
+                    "get_gizmos", home["gizmos"], "gizmos", home_id=home["id"]
+                )
+                valid_homes.append(home)
+
+            _LOGGER.info("Found %d valid homes for %s", len(valid_homes), self._email)
+            self._cache.set_smart("get_homes", valid_homes, "homes", email=self._email)
+            return valid_homes
+        except ApiError:
+            raise
+        except Exception as e:
+            _LOGGER.exception(
+                "Unexpected error fetching homes with gizmos for %s: %s",
+                self._email,
+                str(e),
+            )
+            raise ApiError(f"Failed to fetch homes: {e!s}") from e
+
     async def async_get_grid_rewards_history(
         self,
         home_id: str,
@@ -582,7 +897,7 @@ class TibberApiClient:
             raise ApiError("Invalid home_id provided")
 
         # Validate UUID format for home_id
-        if not UUID_PATTERN.match(home_id):
+        if not _is_uuid(home_id):
             _LOGGER.error("Invalid home_id format in rewards history: %s", home_id[:8])
             raise ApiError("Invalid home_id - Must be a valid UUID")
 
@@ -591,30 +906,28 @@ class TibberApiClient:
         if not to_date_str or not isinstance(to_date_str, str):
             raise ApiError("Invalid to_date provided")
 
-        # Basic ISO date format validation
+        # Basic ISO date format validation (fromisoformat accepts "Z" natively)
         try:
-            datetime.fromisoformat(from_date_str.replace("Z", "+00:00"))
-            datetime.fromisoformat(to_date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError) as e:
+            datetime.fromisoformat(from_date_str)
+            to_dt = datetime.fromisoformat(to_date_str)
+        except ValueError as e:
             raise ApiError(f"Invalid date format: {e}") from e
 
         # Determine cache data type based on date range
         cache_type = "rewards_daily" if use_daily_resolution else "rewards_monthly"
-        to_dt = datetime.fromisoformat(to_date_str.replace("Z", "+00:00"))
-        now = datetime.now(UTC)
 
         # Check if this is historical data (ended more than 1 day ago)
-        if to_dt < now - timedelta(days=1):
+        if to_dt.timestamp() < time.time() - 86400:
             cache_type = "rewards_historical"
 
         # Check cache first
-        cached_rewards = self._cache.get(
-            "get_grid_rewards",
-            home_id=home_id,
-            from_date=from_date_str,
-            to_date=to_date_str,
-            resolution="daily" if use_daily_resolution else "monthly",
-        )
+        cache_kwargs = {
+            "home_id": home_id,
+            "from_date": from_date_str,
+            "to_date": to_date_str,
+            "resolution": "daily" if use_daily_resolution else "monthly",
+        }
+        cached_rewards = self._cache.get("get_grid_rewards", **cache_kwargs)
         if cached_rewards is not None:
             _LOGGER.debug("Using cached rewards data for %s", cache_type)
             return cached_rewards
@@ -629,10 +942,16 @@ class TibberApiClient:
             if use_daily_resolution
             else GRID_REWARDS_QUERY_TEMPLATE
         )
-        response_data_field = await self._graphql_request(
-            query=query_template,
-            variables=variables,
-        )
+        try:
+            response_data_field = await self._graphql_request(
+                query=query_template,
+                variables=variables,
+            )
+        except ApiAuthError:
+            raise
+        except ApiError as err:
+            stale = self._stale_or_raise(err, "get_grid_rewards", **cache_kwargs)
+            return {**stale, "_stale": True}
         default_return = {
             "ev": None,
             "homevolt": None,
@@ -665,22 +984,23 @@ class TibberApiClient:
                 "from_date_api": rewards_data_period.get("from"),
                 "to_date_api": rewards_data_period.get("to"),
             }
+            if result["currency"]:
+                self._currency = result["currency"]
 
             # Cache the rewards data with appropriate TTL
             self._cache.set_smart(
-                "get_grid_rewards",
-                result,
-                cache_type,
-                home_id=home_id,
-                from_date=from_date_str,
-                to_date=to_date_str,
-                resolution="daily" if use_daily_resolution else "monthly",
+                "get_grid_rewards", result, cache_type, **cache_kwargs
             )
             return result
         except Exception:
             _LOGGER.exception("Error parsing rewards data for home %s.", home_id)
             return default_return
 
+    @property
+    def currency(self) -> str | None:
+        """Return the home currency seen in the last rewards response."""
+        return self._currency
+
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         return self._cache.get_stats()
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
-import hashlib
+from collections import OrderedDict
 import json
 import logging
 import time
@@ -11,32 +10,41 @@ from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# Argument types whose repr is stable enough to build cache keys from
+_SIMPLE_TYPES = (str, int, float, bool, type(None))
+
 
 class ApiCache:
     """Cache for API responses to reduce unnecessary calls."""
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, max_size: int = 256):
         """Initialize cache with default TTL in seconds.
 
         Args:
             default_ttl: Default time-to-live for cache entries in seconds
+            max_size: Maximum number of entries before evicting the least
+                recently used one
         """
-        self._cache: dict[
-            str,
-            tuple[Any, float, float],
-        ] = {}  # key -> (data, expiry_time, cached_at)
+        # key -> (data, expiry_time, method), least recently used first
+        self._cache: OrderedDict[str, tuple[Any, float, str]] = OrderedDict()
         self._default_ttl = default_ttl
+        self._max_size = max_size
         self._hit_count = 0
         self._miss_count = 0
+        # Last stats snapshot and the (hits, misses, entries) it was built from
+        self._stats: dict[str, Any] = {}
+        self._stats_counters: tuple[int, int, int] | None = None
         _LOGGER.debug("Cache initialized with default TTL: %d seconds", default_ttl)
 
     def _make_key(self, method: str, **kwargs: Any) -> str:
         """Create a cache key from method name and arguments."""
         # Sort kwargs for consistent key generation
         sorted_kwargs = sorted(kwargs.items())
-        key_data = f"{method}:{json.dumps(sorted_kwargs, sort_keys=True, default=str)}"
-        # Use SHA256 for better collision resistance
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        # Keys never leave this process, so plain strings need no hashing;
+        # JSON is only needed for values without a stable repr
+        if all(isinstance(value, _SIMPLE_TYPES) for _, value in sorted_kwargs):
+            return method + "".join(f"|{k}={v!r}" for k, v in sorted_kwargs)
+        return f"{method}:{json.dumps(sorted_kwargs, sort_keys=True, default=str)}"
 
     def get(self, method: str, **kwargs: Any) -> Any | None:
         """Get cached data if available and not expired.
@@ -51,28 +59,76 @@ class ApiCache:
         key = self._make_key(method, **kwargs)
 
         if key in self._cache:
-            data, expiry_time, cached_at, _ = self._cache[key]
+            self._cache.move_to_end(key)
+            data, expiry_time, _ = self._cache[key]
             current_time = time.time()
 
             if current_time < expiry_time:
                 self._hit_count += 1
-                age = current_time - cached_at
                 _LOGGER.debug(
-                    "Cache HIT for %s (age: %.1fs, expires in: %.1fs)",
+                    "Cache HIT for %s (expires in: %.1fs)",
                     method,
-                    age,
                     expiry_time - current_time,
                 )
                 return data
 
-            # Expired entry - remove it
-            del self._cache[key]
+            # Expired entry - kept as a fallback until cleanup()
             _LOGGER.debug("Cache expired for %s", method)
 
         self._miss_count += 1
         _LOGGER.debug("Cache MISS for %s", method)
         return None
 
+    def get_with_status(
+        self, method: str, stale_for: float, **kwargs: Any
+    ) -> tuple[Any | None, str]:
+        """Get cached data along with its freshness.
+
+        Expired entries are still served for stale_for seconds past their
+        expiry so callers can revalidate them in the background.
+
+        Args:
+            method: The API method name
+            stale_for: Seconds past expiry an entry may still be served
+            **kwargs: Method arguments
+
+        Returns:
+            Tuple of (data, status) where status is "fresh", "stale" or "miss"
+        """
+        key = self._make_key(method, **kwargs)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            data, expiry_time, _ = self._cache[key]
+            current_time = time.time()
+
+            if current_time < expiry_time:
+                self._hit_count += 1
+                return data, "fresh"
+            if current_time < expiry_time + stale_for:
+                self._hit_count += 1
+                _LOGGER.debug("Cache STALE for %s", method)
+                return data, "stale"
+
+        self._miss_count += 1
+        _LOGGER.debug("Cache MISS for %s", method)
+        return None, "miss"
+
+    def get_stale(self, method: str, **kwargs: Any) -> Any | None:
+        """Get the last cached data regardless of expiry.
+
+        Used as a fallback when the API is unavailable.
+
+        Args:
+            method: The API method name
+            **kwargs: Method arguments
+
+        Returns:
+            Last cached data if any, None otherwise
+        """
+        entry = self._cache.get(self._make_key(method, **kwargs))
+        return entry[0] if entry is not None else None
+
     def set(
         self, method: str, data: Any, ttl: int | None = None, **kwargs: Any
     ) -> None:
@@ -89,7 +145,12 @@ class ApiCache:
         current_time = time.time()
         expiry_time = current_time + ttl
 
-        self._cache[key] = (data, expiry_time, current_time, method)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self._max_size:
+            # Bound memory by evicting the least recently used entry
+            self._cache.popitem(last=False)
+        self._cache[key] = (data, expiry_time, method)
         _LOGGER.debug("Cached %s for %d seconds", method, ttl)
 
     def invalidate(self, method: str | None = None, **kwargs: Any) -> None:
@@ -114,7 +175,7 @@ class ApiCache:
             # Clear all entries for a method - filter by method name
             keys_to_delete = [
                 key
-                for key, (_, _, _, cached_method) in self._cache.items()
+                for key, (_, _, cached_method) in self._cache.items()
                 if cached_method == method
             ]
             for key in keys_to_delete:
@@ -130,7 +191,7 @@ class ApiCache:
         current_time = time.time()
         expired_keys = []
 
-        for key, (_, expiry_time, _, _) in self._cache.items():
+        for key, (_, expiry_time, _) in self._cache.items():
             if current_time >= expiry_time:
                 expired_keys.append(key)
 
@@ -141,17 +202,24 @@ class ApiCache:
             _LOGGER.debug("Cleaned up %d expired cache entries", len(expired_keys))
 
     def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics."""
-        total_requests = self._hit_count + self._miss_count
-        hit_rate = (self._hit_count / total_requests * 100) if total_requests > 0 else 0
-
-        return {
-            "entries": len(self._cache),
-            "hits": self._hit_count,
-            "misses": self._miss_count,
-            "hit_rate": hit_rate,
-            "total_requests": total_requests,
-        }
+        """Get cache statistics.
+
+        The snapshot is reused until the counters or size change, so callers
+        must treat it as read-only.
+        """
+        counters = (self._hit_count, self._miss_count, len(self._cache))
+        if counters != self._stats_counters:
+            hits, misses, entries = counters
+            total_requests = hits + misses
+            self._stats = {
+                "entries": entries,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": (hits / total_requests * 100) if total_requests > 0 else 0,
+                "total_requests": total_requests,
+            }
+            self._stats_counters = counters
+        return self._stats
 
     def __str__(self) -> str:
         """String representation of cache stats."""
@@ -175,6 +243,11 @@ class SmartCache(ApiCache):
             "rewards_monthly": 900,  # 15 minutes - current month data
             "rewards_historical": 3600,  # 1 hour - historical data doesn't change
         }
+        # How long expired entries may still be served while being refreshed
+        self.stale_config = {
+            "homes": 600,  # 10 minutes - homes rarely change
+            "gizmos": 3600,  # 1 hour - devices change occasionally
+        }
 
     def set_smart(self, method: str, data: Any, data_type: str, **kwargs: Any) -> None:
         """Store data with intelligent TTL based on data type.
@@ -190,15 +263,13 @@ class SmartCache(ApiCache):
         # Adaptive TTL based on time patterns
         if data_type == "rewards_daily":
             # Cache for shorter time near end of day (when rewards might update)
-            now = datetime.now(UTC)
-            hours_until_midnight = 24 - now.hour
+            hours_until_midnight = 24 - time.gmtime().tm_hour
             if hours_until_midnight <= 2:
                 ttl = 60  # 1 minute cache near midnight
         elif data_type == "rewards_monthly":
             # Cache for shorter time near end of month
-            now = datetime.now(UTC)
             days_in_month = 31  # Approximate
-            if now.day >= days_in_month - 2:
+            if time.gmtime().tm_mday >= days_in_month - 2:
                 ttl = 300  # 5 minute cache near month end
 
         self.set(method, data, ttl, **kwargs)
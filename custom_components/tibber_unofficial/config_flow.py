@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 import logging
 from typing import Any
 
-import aiohttp
 from homeassistant import config_entries
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.loader import async_get_integration
 import voluptuous as vol
 
 from .api import ApiAuthError, ApiError, TibberApiClient
@@ -18,6 +17,8 @@ from .const import (
     CONF_GIZMO_IDS,
     CONF_HOME_ID,
     CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_TOKEN_EXPIRES_AT,
     DESIRED_GIZMO_TYPES,
     DOMAIN,
 )
@@ -65,32 +66,20 @@ class TibberConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
         """Handle the initial step (email/password authentication)."""
         errors: dict[str, str] = {}
         if user_input is not None:
-            try:
-                # Validate and sanitize inputs
-                email = user_input[CONF_EMAIL].strip().lower()
-                password = user_input[CONF_PASSWORD].strip()
-            except vol.Invalid as exc:
-                _LOGGER.warning("Input validation failed: %s", exc)
-                errors["base"] = "invalid_input"
-                return self.async_show_form(
-                    step_id="user",
-                    data_schema=USER_DATA_SCHEMA,
-                    errors=errors,
-                    description_placeholders={"error": str(exc)},
-                )
-
-            # Create a temporary session for config flow
-            timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
-            session = async_create_clientsession(
-                self.hass,
-                timeout=timeout,
-            )
+            # The flow manager already validated user_input against
+            # USER_DATA_SCHEMA on submit; only normalize it here
+            email = user_input[CONF_EMAIL].strip().lower()
+            password = user_input[CONF_PASSWORD].strip()
 
+            # Share Home Assistant's session and its warm connection pool;
+            # request timeouts are set per call by the client
             try:
+                integration = await async_get_integration(self.hass, DOMAIN)
                 self.api_client = TibberApiClient(
-                    session=session,
+                    session=async_get_clientsession(self.hass),
                     email=email,
                     password=password,
+                    version=str(integration.version),
                 )
                 self.user_auth_data = {
                     CONF_EMAIL: email,
@@ -111,10 +100,6 @@ class TibberConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
             except Exception as e:
                 _LOGGER.exception("Unexpected error during authentication: %s", str(e))
                 errors["base"] = "unknown"
-            finally:
-                # Clean up the session on errors (success case handled by HA)
-                if errors:
-                    await session.close()
 
         return self.async_show_form(
             step_id="user",
@@ -132,8 +117,9 @@ class TibberConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
                 _LOGGER.error("API client not initialized - This should not happen")
                 return self.async_abort(reason="api_client_not_initialized")
 
-            _LOGGER.debug("Fetching homes for user selection")
-            homes = await self.api_client.async_get_homes()
+            # Homes and their gizmos arrive in a single request
+            _LOGGER.debug("Fetching homes and gizmos for user selection")
+            homes = await self.api_client.async_get_homes_with_gizmos()
             if not homes:
                 _LOGGER.warning(
                     "No homes found for account %s - User may not have Tibber homes configured",
@@ -186,20 +172,24 @@ class TibberConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
                 home_id_prefix,
                 self.user_auth_data.get(CONF_EMAIL),
             )
-            _LOGGER.debug(
-                "Home details: %s",
-                {k: v for k, v in selected_home.items() if k != "id"},
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Home details: %s",
+                    {
+                        k: v
+                        for k, v in selected_home.items()
+                        if k not in {"id", "gizmos"}
+                    },
+                )
 
-            _LOGGER.debug("Fetching gizmos for selected home")
-            gizmos = await self.api_client.async_get_gizmos(selected_home_id)
-            gizmo_ids_by_type: dict[str, list[str]] = defaultdict(list)
+            gizmos = selected_home.get("gizmos", [])
+            gizmo_ids_by_type: dict[str, list[str]] = {}
             if isinstance(gizmos, list):
                 for gizmo in gizmos:
-                    gizmo_type = gizmo.get("type")
-                    gizmo_id = gizmo.get("id")
-                    if gizmo_type in DESIRED_GIZMO_TYPES and gizmo_id:
-                        gizmo_ids_by_type[gizmo_type].append(gizmo_id)
+                    if (gizmo_type := gizmo.get("type")) in DESIRED_GIZMO_TYPES and (
+                        gizmo_id := gizmo.get("id")
+                    ):
+                        gizmo_ids_by_type.setdefault(gizmo_type, []).append(gizmo_id)
             else:
                 _LOGGER.warning(
                     "Invalid gizmos data for home %s - Expected list, got: %s",
@@ -213,18 +203,19 @@ class TibberConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
                 if gizmo_ids_by_type
                 else "None",
             )
-            _LOGGER.debug("Gizmo IDs: %s", dict(gizmo_ids_by_type))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Gizmo IDs: %s", gizmo_ids_by_type)
 
-            entry_data = {
-                CONF_EMAIL: self.user_auth_data[CONF_EMAIL],
-                CONF_PASSWORD: self.user_auth_data[CONF_PASSWORD],
+            entry_data = self.user_auth_data | {
                 CONF_HOME_ID: selected_home_id,
-                CONF_GIZMO_IDS: dict(gizmo_ids_by_type),
+                CONF_GIZMO_IDS: gizmo_ids_by_type,
             }
+            # Hand the login token to the first setup so it can skip a login
+            if token_state := self.api_client.token_state:
+                entry_data[CONF_TOKEN], entry_data[CONF_TOKEN_EXPIRES_AT] = token_state
 
-            unique_flow_id = (
-                f"{self.user_auth_data[CONF_EMAIL].lower()}_{selected_home_id}"
-            )
+            # The email was normalized to lower case in async_step_user
+            unique_flow_id = f"{self.user_auth_data[CONF_EMAIL]}_{selected_home_id}"
             await self.async_set_unique_id(unique_flow_id)
             self._abort_if_unique_id_configured(updates=entry_data)
 
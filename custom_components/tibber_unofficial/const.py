@@ -11,12 +11,28 @@ PLATFORMS = ["sensor"]
 # Default polling intervals
 DEFAULT_REWARDS_SCAN_INTERVAL = timedelta(minutes=15)
 DEFAULT_GIZMO_SCAN_INTERVAL = timedelta(hours=12)
+DEFAULT_REWARDS_SCAN_INTERVAL_MINUTES = int(
+    DEFAULT_REWARDS_SCAN_INTERVAL.total_seconds() // 60
+)
+DEFAULT_GIZMO_SCAN_INTERVAL_HOURS = int(
+    DEFAULT_GIZMO_SCAN_INTERVAL.total_seconds() // 3600
+)
+
+# Upper bound in seconds for one coordinator fetch, including the API
+# client's own retries and backoff
+API_FETCH_TIMEOUT = 60
+
+# How often cache statistics are logged
+CACHE_STATS_LOG_INTERVAL = timedelta(hours=1)
 
 # Configuration keys
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
 CONF_HOME_ID = "home_id"
 CONF_GIZMO_IDS = "gizmo_ids"
+# Token from the config flow login, moved to token storage on first setup
+CONF_TOKEN = "token"
+CONF_TOKEN_EXPIRES_AT = "token_expires_at"
 
 # API Endpoints
 API_AUTH_URL = "https://app.tibber.com/login.credentials"
@@ -53,10 +69,7 @@ HOMES_QUERY = """
   me {
     homes {
       id
-      timeZone
-      hasSmartMeterCapabilities
       hasSignedEnergyDeal
-      hasConsumption
     }
   }
 }
@@ -68,12 +81,27 @@ query GetGizmos($homeId: String!) {
   me {
     home(id: $homeId) {
       gizmos {
-        __typename
         ... on Gizmo {
           id
-          title
           type
-          isHidden
+        }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL Query to fetch homes together with their gizmos in one request
+HOMES_WITH_GIZMOS_QUERY = """
+{
+  me {
+    homes {
+      id
+      hasSignedEnergyDeal
+      gizmos {
+        ... on Gizmo {
+          id
+          type
         }
       }
     }
@@ -108,14 +136,20 @@ query GetGridRewards($homeId: String!, $fromDate: String!, $toDate: String!) {
 GRID_REWARDS_DAILY_QUERY_TEMPLATE = GRID_REWARDS_QUERY_TEMPLATE
 
 # Desired Gizmo types to extract IDs for
-DESIRED_GIZMO_TYPES = [
-    "REAL_TIME_METER",
-    "INVERTER",
-    "BATTERY",
-    "ELECTRIC_VEHICLE",
-    "EV_CHARGER",
-]
+DESIRED_GIZMO_TYPES = frozenset(
+    {
+        "REAL_TIME_METER",
+        "INVERTER",
+        "BATTERY",
+        "ELECTRIC_VEHICLE",
+        "EV_CHARGER",
+    }
+)
 
 # Keys for storing coordinators in hass.data
 COORDINATOR_REWARDS = "rewards_coordinator"
 COORDINATOR_GIZMOS = "gizmos_coordinator"
+
+# Coordinator names used in logs
+COORDINATOR_REWARDS_NAME = f"{DOMAIN} Grid Rewards Data"
+COORDINATOR_GIZMOS_NAME = f"{DOMAIN} Gizmo Data"
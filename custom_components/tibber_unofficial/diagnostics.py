@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 import logging
 from typing import Any
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
@@ -14,17 +14,19 @@ from .const import COORDINATOR_GIZMOS, COORDINATOR_REWARDS, DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 # Data to redact for privacy
-TO_REDACT = {
-    "email",
-    "password",
-    "token",
-    "access_token",
-    "refresh_token",
-    "home_id",
-    "gizmo_id",
-    "user_id",
-    "account_id",
-}
+TO_REDACT = frozenset(
+    {
+        "email",
+        "password",
+        "token",
+        "access_token",
+        "refresh_token",
+        "home_id",
+        "gizmo_id",
+        "user_id",
+        "account_id",
+    }
+)
 
 
 async def async_get_config_entry_diagnostics(
@@ -32,6 +34,25 @@ async def async_get_config_entry_diagnostics(
     entry: ConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    return await _collect_diagnostics(
+        hass,
+        entry,
+        hass.helpers.entity_registry.async_get(hass),
+        hass.helpers.device_registry.async_get(hass),
+    )
+
+
+async def _collect_diagnostics(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    entity_registry: Any,
+    device_registry: Any,
+    entity_ids: set[str] | None = None,
+) -> dict[str, Any]:
+    """Build diagnostics from already fetched registries.
+
+    If entity_ids is given, only those entities are included.
+    """
     data = hass.data[DOMAIN][entry.entry_id]
 
     # Get coordinator data
@@ -73,10 +94,7 @@ async def async_get_config_entry_diagnostics(
             "data_keys": list(rewards_coordinator.data.keys())
             if rewards_coordinator.data
             else [],
-            "home_id_redacted": async_redact_data(
-                {"home_id": rewards_coordinator.home_id},
-                TO_REDACT,
-            )["home_id"],
+            "home_id_redacted": REDACTED,
         }
 
     # Add gizmos coordinator diagnostics
@@ -93,10 +111,7 @@ async def async_get_config_entry_diagnostics(
             "data_keys": list(gizmos_coordinator.data.keys())
             if gizmos_coordinator.data
             else [],
-            "home_id_redacted": async_redact_data(
-                {"home_id": gizmos_coordinator.home_id},
-                TO_REDACT,
-            )["home_id"],
+            "home_id_redacted": REDACTED,
         }
 
     # Add API client diagnostics
@@ -110,34 +125,29 @@ async def async_get_config_entry_diagnostics(
                 is not None
                 else None
             ),
-            "cache_stats": api_client.get_cache_stats()
-            if hasattr(api_client, "get_cache_stats")
+            "cache_stats": cache_stats()
+            if (cache_stats := getattr(api_client, "get_cache_stats", None)) is not None
             else {},
             "rate_limiter_stats": {
-                "hourly_tokens": getattr(
-                    api_client._rate_limiter.hourly,
-                    "tokens",
-                    None,
-                ),
-                "burst_tokens": getattr(api_client._rate_limiter.burst, "tokens", None),
+                "hourly_tokens": rate_limiter.hourly.tokens,
+                "burst_tokens": rate_limiter.burst.tokens,
             }
-            if hasattr(api_client, "_rate_limiter")
+            if (rate_limiter := getattr(api_client, "_rate_limiter", None)) is not None
             else {},
         }
 
     # Add entity diagnostics
-    entity_registry = hass.helpers.entity_registry.async_get(hass)
-    device_registry = hass.helpers.device_registry.async_get(hass)
-
     entities = hass.helpers.entity_registry.async_entries_for_config_entry(
         entity_registry,
         entry.entry_id,
     )
 
     for entity in entities:
+        if entity_ids is not None and entity.entity_id not in entity_ids:
+            continue
         entity_data = {
             "entity_id": entity.entity_id,
-            "unique_id": async_redact_data({"uid": entity.unique_id}, TO_REDACT)["uid"],
+            "unique_id": entity.unique_id,
             "platform": entity.platform,
             "device_class": entity.device_class,
             "unit_of_measurement": entity.unit_of_measurement,
@@ -148,9 +158,17 @@ async def async_get_config_entry_diagnostics(
         # Get entity state
         state = hass.states.get(entity.entity_id)
         if state:
+            attributes = state.attributes
+            if not TO_REDACT.isdisjoint(attributes):
+                # Sensor attributes are flat, so one pass redacts them
+                attributes = {
+                    key: REDACTED if key in TO_REDACT else value
+                    for key, value in attributes.items()
+                }
             entity_data["state"] = {
                 "state": state.state,
-                "attributes": async_redact_data(dict(state.attributes), TO_REDACT),
+                # Read-only and serialized by Home Assistant, so not copied
+                "attributes": attributes,
                 "last_changed": state.last_changed.isoformat(),
                 "last_updated": state.last_updated.isoformat(),
             }
@@ -170,10 +188,7 @@ async def async_get_config_entry_diagnostics(
             "model": device.model,
             "sw_version": device.sw_version,
             "hw_version": device.hw_version,
-            "identifiers": async_redact_data(
-                {"ids": list(device.identifiers)},
-                TO_REDACT,
-            )["ids"],
+            "identifiers": list(device.identifiers),
             "connections": list(device.connections),
             "disabled": device.disabled,
             "disabled_by": device.disabled_by.value if device.disabled_by else None,
@@ -189,32 +204,35 @@ async def async_get_device_diagnostics(
     device: DeviceEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a device entry."""
-    data = await async_get_config_entry_diagnostics(hass, entry)
-
-    # Filter to only this device
-    device_data = None
-    for dev in data.get("devices", []):
-        if any(
-            identifier in device.identifiers
-            for identifier in dev.get("identifiers", [])
-        ):
-            device_data = dev
-            break
-
-    # Filter entities to only those for this device
+    # Only build entity diagnostics for this device's entities
     entity_registry = hass.helpers.entity_registry.async_get(hass)
-    device_entities = hass.helpers.entity_registry.async_entries_for_device(
+    device_entity_ids = {
+        entity.entity_id
+        for entity in hass.helpers.entity_registry.async_entries_for_device(
+            entity_registry,
+            device.id,
+        )
+    }
+    data = await _collect_diagnostics(
+        hass,
+        entry,
         entity_registry,
-        device.id,
+        hass.helpers.device_registry.async_get(hass),
+        entity_ids=device_entity_ids,
     )
 
-    filtered_entities = []
-    for entity in data.get("entities", []):
-        if any(e.entity_id == entity["entity_id"] for e in device_entities):
-            filtered_entities.append(entity)
+    # Filter to only this device
+    device_data = next(
+        (
+            dev
+            for dev in data.get("devices", [])
+            if not device.identifiers.isdisjoint(dev.get("identifiers", []))
+        ),
+        None,
+    )
 
     return {
         "device": device_data,
-        "entities": filtered_entities,
+        "entities": data.get("entities", []),
         "system_info": data["system_info"],
     }
@@ -9,7 +9,10 @@ from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
-from .const import DEFAULT_GIZMO_SCAN_INTERVAL, DEFAULT_REWARDS_SCAN_INTERVAL
+from .const import (
+    DEFAULT_GIZMO_SCAN_INTERVAL_HOURS,
+    DEFAULT_REWARDS_SCAN_INTERVAL_MINUTES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +24,20 @@ CONF_GIZMO_SCAN_INTERVAL = "gizmo_scan_interval"
 MIN_REWARDS_INTERVAL = 5  # minutes
 MIN_GIZMO_INTERVAL = 1  # hours
 
+# Built once; current values are filled in as suggested values per form
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_REWARDS_SCAN_INTERVAL): vol.All(
+            cv.positive_int,
+            vol.Range(min=MIN_REWARDS_INTERVAL, max=1440),  # Max 24 hours
+        ),
+        vol.Required(CONF_GIZMO_SCAN_INTERVAL): vol.All(
+            cv.positive_int,
+            vol.Range(min=MIN_GIZMO_INTERVAL, max=168),  # Max 1 week
+        ),
+    },
+)
+
 
 class TibberOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Tibber Unofficial."""
@@ -41,31 +58,20 @@ class TibberOptionsFlow(config_entries.OptionsFlow):
         # Get current values or defaults
         rewards_interval = self.config_entry.options.get(
             CONF_REWARDS_SCAN_INTERVAL,
-            int(DEFAULT_REWARDS_SCAN_INTERVAL.total_seconds() / 60),
+            DEFAULT_REWARDS_SCAN_INTERVAL_MINUTES,
         )
         gizmo_interval = self.config_entry.options.get(
             CONF_GIZMO_SCAN_INTERVAL,
-            int(DEFAULT_GIZMO_SCAN_INTERVAL.total_seconds() / 3600),
+            DEFAULT_GIZMO_SCAN_INTERVAL_HOURS,
         )
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA,
                 {
-                    vol.Required(
-                        CONF_REWARDS_SCAN_INTERVAL,
-                        default=rewards_interval,
-                    ): vol.All(
-                        cv.positive_int,
-                        vol.Range(min=MIN_REWARDS_INTERVAL, max=1440),  # Max 24 hours
-                    ),
-                    vol.Required(
-                        CONF_GIZMO_SCAN_INTERVAL,
-                        default=gizmo_interval,
-                    ): vol.All(
-                        cv.positive_int,
-                        vol.Range(min=MIN_GIZMO_INTERVAL, max=168),  # Max 1 week
-                    ),
+                    CONF_REWARDS_SCAN_INTERVAL: rewards_interval,
+                    CONF_GIZMO_SCAN_INTERVAL: gizmo_interval,
                 },
             ),
             description_placeholders={
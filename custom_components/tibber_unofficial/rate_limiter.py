@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
+import contextlib
 import logging
 import time
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# Response headers that may report the server-side remaining quota
+_REMAINING_HEADERS = ("X-RateLimit-Remaining", "X-RateLimit-Remaining-Requests")
+
 
 class RateLimiter:
     """Rate limiter using token bucket algorithm."""
@@ -26,27 +31,44 @@ class RateLimiter:
         self.last_update = time.monotonic()
         self._lock = asyncio.Lock()
 
+    def _refill(self, now: float) -> float:
+        """Add the tokens accrued since the last update.
+
+        Returns the seconds until a whole token is available, 0 if one is.
+        """
+        if now < self.last_update:
+            # Refill is paused until the server's Retry-After has passed
+            return (
+                self.last_update
+                - now
+                + (max(0.0, 1 - self.tokens) * self.period) / self.calls
+            )
+        # Add tokens based on time elapsed
+        elapsed = now - self.last_update
+        self.tokens = min(
+            self.calls, self.tokens + elapsed * (self.calls / self.period)
+        )
+        self.last_update = now
+        if self.tokens >= 1:
+            return 0.0
+        # Calculate wait time until next token
+        return ((1 - self.tokens) * self.period) / self.calls
+
     async def acquire(self) -> None:
         """Acquire permission to make a call, waiting if necessary."""
+        # Nobody is queued and a whole token is due; refilling and taking it
+        # cannot be interleaved without an await, so no lock is needed
+        if not self._lock.locked() and not self._refill(time.monotonic()):
+            self.tokens -= 1
+            return
         async with self._lock:
-            while True:
-                now = time.monotonic()
-                elapsed = now - self.last_update
-
-                # Add tokens based on time elapsed
-                tokens_to_add = elapsed * (self.calls / self.period)
-                self.tokens = min(self.calls, self.tokens + tokens_to_add)
-                self.last_update = now
-
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    return
-
-                # Calculate wait time until next token
-                tokens_needed = 1 - self.tokens
-                wait_time = (tokens_needed * self.period) / self.calls
+            now = time.monotonic()
+            if wait_time := self._refill(now):
                 _LOGGER.debug("Rate limit reached, waiting %.2f seconds", wait_time)
                 await asyncio.sleep(wait_time)
+                # The wait ends exactly when a token is due, so no re-check
+                self._refill(now + wait_time)
+            self.tokens -= 1
 
     def reset(self) -> None:
         """Reset the rate limiter to full capacity."""
@@ -68,44 +90,73 @@ class MultiTierRateLimiter:
         self.hourly = RateLimiter(80, 3600)  # 80 calls per hour
         self.burst = RateLimiter(20, 900)  # 20 calls per 15 minutes
         self._storage = storage
-        self._last_save_time = time.monotonic()
-        self._save_interval = 60  # Save state every minute
+        self._save_interval = 60  # Delay before persisting state, in seconds
+        # One critical section covers both buckets, so a token is only taken
+        # from either once both can grant one
+        self._lock = asyncio.Lock()
 
     async def initialize(self) -> None:
         """Load saved state from storage if available."""
         if self._storage:
             try:
                 await self._storage.async_load()
-                hourly_tokens, burst_tokens = self._storage.get_tokens()
-                self.hourly.tokens = hourly_tokens
-                self.burst.tokens = burst_tokens
+                self.hourly.tokens = self._storage.hourly_tokens
+                self.burst.tokens = self._storage.burst_tokens
                 _LOGGER.debug(
                     "Restored rate limiter state: hourly=%.1f, burst=%.1f",
-                    hourly_tokens,
-                    burst_tokens,
+                    self.hourly.tokens,
+                    self.burst.tokens,
                 )
             except Exception as e:
                 _LOGGER.warning("Failed to restore rate limiter state: %s", e)
 
     async def acquire(self) -> None:
         """Acquire permission from all rate limiters."""
-        await self.hourly.acquire()
-        await self.burst.acquire()
-
-        # Periodically save state
+        if not self._lock.locked() and not max(
+            self.hourly._refill(now := time.monotonic()), self.burst._refill(now)
+        ):
+            # Both buckets have a token due and nobody is queued
+            self.hourly.tokens -= 1
+            self.burst.tokens -= 1
+        else:
+            async with self._lock:
+                now = time.monotonic()
+                if wait_time := max(self.hourly._refill(now), self.burst._refill(now)):
+                    _LOGGER.debug("Rate limit reached, waiting %.2f seconds", wait_time)
+                    await asyncio.sleep(wait_time)
+                    # Both buckets have a token due by the end of the longer wait
+                    self.hourly._refill(now + wait_time)
+                    self.burst._refill(now + wait_time)
+                self.hourly.tokens -= 1
+                self.burst.tokens -= 1
+
+        # Persist state off the request path; Store coalesces the writes
         if self._storage:
-            current_time = time.monotonic()
-            if current_time - self._last_save_time > self._save_interval:
-                await self._save_state()
-                self._last_save_time = current_time
+            self._storage.async_delay_save(self._tokens, self._save_interval)
 
-    async def _save_state(self) -> None:
-        """Save current state to storage."""
-        if self._storage:
+    def _tokens(self) -> tuple[float, float]:
+        """Return the current hourly and burst token counts."""
+        return self.hourly.tokens, self.burst.tokens
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Throttle to the quota reported in API response headers.
+
+        Lowers the hourly bucket to the server's remaining request count and
+        pauses its refill for any Retry-After period.
+        """
+        for name in _REMAINING_HEADERS:
+            if (remaining := headers.get(name)) is not None:
+                with contextlib.suppress(ValueError):
+                    self.hourly.tokens = min(self.hourly.tokens, float(remaining))
+                break
+        if (retry_after := headers.get("Retry-After")) is not None:
             try:
-                await self._storage.async_save(self.hourly.tokens, self.burst.tokens)
-            except Exception as e:
-                _LOGGER.debug("Failed to save rate limiter state: %s", e)
+                delay = float(retry_after)
+            except ValueError:
+                return  # HTTP-date form, handled by the 429 backoff
+            self.hourly.tokens = min(self.hourly.tokens, 0.0)
+            self.hourly.last_update = time.monotonic() + delay
+            _LOGGER.debug("Server requested a %.0f second pause", delay)
 
     def reset(self) -> None:
         """Reset all rate limiters."""
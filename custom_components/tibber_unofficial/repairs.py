@@ -3,14 +3,17 @@
 import logging
 from typing import Any
 
-import aiohttp
 from homeassistant.components.repairs import ConfirmRepairFlow, RepairsFlow
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv, issue_registry as ir
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.loader import async_get_integration
 import voluptuous as vol
 
 from .api import ApiAuthError, TibberApiClient
+from .const import DOMAIN
+from .storage import TokenStorage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,18 +70,18 @@ class AuthFailedRepairFlow(RepairsFlow):
         errors = {}
         try:
             # Test authentication with new credentials
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                api_client = TibberApiClient(
-                    session=session,
-                    email=user_input["email"],
-                    password=user_input["password"],
-                )
-                await api_client.authenticate()
-                _LOGGER.info(
-                    "Authentication repair successful for %s",
-                    user_input["email"],
-                )
+            integration = await async_get_integration(self.hass, DOMAIN)
+            api_client = TibberApiClient(
+                session=async_get_clientsession(self.hass),
+                email=user_input["email"],
+                password=user_input["password"],
+                version=str(integration.version),
+            )
+            await api_client.authenticate()
+            _LOGGER.info(
+                "Authentication repair successful for %s",
+                user_input["email"],
+            )
 
         except ApiAuthError:
             errors["base"] = "invalid_auth"
@@ -106,6 +109,9 @@ class AuthFailedRepairFlow(RepairsFlow):
                 new_data["email"] = user_input["email"]
                 new_data["password"] = user_input["password"]
 
+                # The stored token belongs to the old login; drop it before the
+                # update can trigger a reload that would restore it
+                await TokenStorage(self.hass, entry.entry_id).async_remove()
                 self.hass.config_entries.async_update_entry(entry, data=new_data)
 
                 # Reload the integration
@@ -67,9 +67,12 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 _LOGGER.error("Entry ID %s not found", entry_id)
                 return
 
-            api_client = hass.data[DOMAIN][entry_id].get("api_client")
+            data = hass.data[DOMAIN][entry_id]
+            api_client = data.get("api_client")
             if api_client and hasattr(api_client, "_cache"):
                 api_client._cache.invalidate()
+                if coordinator := data.get(COORDINATOR_REWARDS):
+                    coordinator.async_clear_period_cache()
                 _LOGGER.info("Cleared cache for entry %s", entry_id)
             else:
                 _LOGGER.error("API client or cache not found for entry %s", entry_id)
@@ -81,6 +84,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     api_client = data.get("api_client")
                     if api_client and hasattr(api_client, "_cache"):
                         api_client._cache.invalidate()
+                        if coordinator := data.get(COORDINATOR_REWARDS):
+                            coordinator.async_clear_period_cache()
                         cleared_count += 1
 
             _LOGGER.info("Cleared cache for %d entries", cleared_count)
@@ -1,9 +1,10 @@
-"""Storage module for persistent data like rate limiter state."""
+"""Storage module for persistent data like rate limiter state and tokens."""
 
+from collections.abc import Callable
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -26,6 +27,9 @@ class RateLimiterStorage:
             f"{STORAGE_KEY_PREFIX}.{entry_id}.rate_limiter",
         )
         self._data: dict[str, Any] = {}
+        # Token counts from the last load or save, read directly on startup
+        self.hourly_tokens = 80.0
+        self.burst_tokens = 20.0
 
     async def async_load(self) -> dict[str, Any]:
         """Load stored rate limiter state."""
@@ -37,21 +41,28 @@ class RateLimiterStorage:
             else:
                 self._data = self._get_default_data()
                 _LOGGER.debug("No stored rate limiter state, using defaults")
-            return self._data
         except Exception as e:
             _LOGGER.error("Failed to load rate limiter state: %s", e)
             self._data = self._get_default_data()
-            return self._data
+        self.hourly_tokens = self._data.get("hourly_tokens", 80.0)
+        self.burst_tokens = self._data.get("burst_tokens", 20.0)
+        return self._data
+
+    def _build_data(self, hourly_tokens: float, burst_tokens: float) -> dict[str, Any]:
+        """Build the stored state for the given token counts."""
+        self.hourly_tokens = hourly_tokens
+        self.burst_tokens = burst_tokens
+        self._data = {
+            "hourly_tokens": hourly_tokens,
+            "burst_tokens": burst_tokens,
+            "last_update": dt_util.now().isoformat(),
+        }
+        return self._data
 
     async def async_save(self, hourly_tokens: float, burst_tokens: float) -> None:
         """Save rate limiter state."""
         try:
-            self._data = {
-                "hourly_tokens": hourly_tokens,
-                "burst_tokens": burst_tokens,
-                "last_update": dt_util.now().isoformat(),
-            }
-            await self._store.async_save(self._data)
+            await self._store.async_save(self._build_data(hourly_tokens, burst_tokens))
             _LOGGER.debug(
                 "Saved rate limiter state: hourly=%.1f, burst=%.1f",
                 hourly_tokens,
@@ -60,6 +71,20 @@ class RateLimiterStorage:
         except Exception as e:
             _LOGGER.error("Failed to save rate limiter state: %s", e)
 
+    @callback
+    def async_delay_save(
+        self, tokens_func: Callable[[], tuple[float, float]], delay: float
+    ) -> None:
+        """Save the token counts from tokens_func after delay seconds.
+
+        Store coalesces repeated calls into one write and flushes any pending
+        write when Home Assistant stops.
+        """
+        self._store.async_delay_save(
+            lambda: self._build_data(*tokens_func()),
+            delay,
+        )
+
     def _get_default_data(self) -> dict[str, Any]:
         """Get default data structure."""
         return {
@@ -68,13 +93,6 @@ class RateLimiterStorage:
             "last_update": dt_util.now().isoformat(),
         }
 
-    def get_tokens(self) -> tuple[float, float]:
-        """Get stored token counts."""
-        return (
-            self._data.get("hourly_tokens", 80.0),
-            self._data.get("burst_tokens", 20.0),
-        )
-
     async def async_remove(self) -> None:
         """Remove stored data."""
         try:
@@ -82,3 +100,45 @@ class RateLimiterStorage:
             _LOGGER.debug("Removed rate limiter storage for %s", self._entry_id)
         except Exception as e:
             _LOGGER.warning("Failed to remove rate limiter storage: %s", e)
+
+
+class TokenStorage:
+    """Persistent storage for the API token, so restarts can skip logging in."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        """Initialize the storage."""
+        self._entry_id = entry_id
+        self._store = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{STORAGE_KEY_PREFIX}.{entry_id}.token",
+        )
+
+    async def async_load(self) -> tuple[str, float, str | None] | None:
+        """Load the stored token, its POSIX expiry and the account email."""
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.error("Failed to load stored token: %s", e)
+            return None
+        if data and data.get("token") and data.get("expires_at"):
+            return data["token"], float(data["expires_at"]), data.get("email")
+        return None
+
+    async def async_save(self, token: str, expires_at: float, email: str) -> None:
+        """Save the token, its POSIX expiry and the account it belongs to."""
+        try:
+            await self._store.async_save(
+                {"token": token, "expires_at": expires_at, "email": email}
+            )
+            _LOGGER.debug("Saved token for %s", self._entry_id)
+        except Exception as e:
+            _LOGGER.error("Failed to save token: %s", e)
+
+    async def async_remove(self) -> None:
+        """Remove stored data."""
+        try:
+            await self._store.async_remove()
+            _LOGGER.debug("Removed token storage for %s", self._entry_id)
+        except Exception as e:
+            _LOGGER.warning("Failed to remove token storage: %s", e)
@@ -1,6 +1,10 @@
 """Tests for the Tibber API client."""
 
+import asyncio
+import base64
 from datetime import UTC, datetime, timedelta
+import json
+import time
 from unittest.mock import AsyncMock, patch
 
 from aiohttp import ClientError
@@ -10,6 +14,10 @@ from custom_components.tibber_unofficial.api import (
     ApiAuthError,
     ApiError,
     TibberApiClient,
+    _encode_payload,
+    _is_uuid,
+    _token_expires_at,
+    _Unauthorized,
 )
 
 
@@ -69,6 +77,7 @@ async def test_get_homes_success():
     )
     client._token = "test_token"
     client._token_expiry_time = datetime.now(UTC) + timedelta(hours=1)
+    client._token_expiry_monotonic = time.monotonic() + 3600
 
     mock_response = AsyncMock()
     mock_response.status = 200
@@ -106,6 +115,7 @@ async def test_get_gizmos_success():
     )
     client._token = "test_token"
     client._token_expiry_time = datetime.now(UTC) + timedelta(hours=1)
+    client._token_expiry_monotonic = time.monotonic() + 3600
 
     mock_response = AsyncMock()
     mock_response.status = 200
@@ -142,6 +152,7 @@ async def test_get_grid_rewards_history_success():
     )
     client._token = "test_token"
     client._token_expiry_time = datetime.now(UTC) + timedelta(hours=1)
+    client._token_expiry_monotonic = time.monotonic() + 3600
 
     mock_response = AsyncMock()
     mock_response.status = 200
@@ -176,6 +187,7 @@ async def test_get_grid_rewards_history_success():
     assert rewards["currency"] == "EUR"
     assert rewards["ev"] == 5.50
     assert rewards["homevolt"] == 10.0
+    assert client.currency == "EUR"
 
 
 @pytest.mark.asyncio
@@ -188,6 +200,7 @@ async def test_cache_integration():
     )
     client._token = "test_token"
     client._token_expiry_time = datetime.now(UTC) + timedelta(hours=1)
+    client._token_expiry_monotonic = time.monotonic() + 3600
 
     mock_response = AsyncMock()
     mock_response.status = 200
@@ -219,6 +232,7 @@ async def test_token_refresh_on_401():
     )
     client._token = "expired_token"
     client._token_expiry_time = datetime.now(UTC) + timedelta(hours=1)
+    client._token_expiry_monotonic = time.monotonic() + 3600
 
     # First call returns 401, triggers re-auth, then succeeds
     mock_response_401 = AsyncMock()
@@ -265,6 +279,7 @@ async def test_api_error_handling():
     )
     client._token = "test_token"
     client._token_expiry_time = datetime.now(UTC) + timedelta(hours=1)
+    client._token_expiry_monotonic = time.monotonic() + 3600
 
     mock_session.post.side_effect = ClientError()
 
@@ -289,7 +304,8 @@ async def test_rate_limiter_integration():
     mock_session = AsyncMock()
     mock_storage = AsyncMock()
     mock_storage.async_load = AsyncMock()
-    mock_storage.get_tokens = AsyncMock(return_value=(80.0, 20.0))
+    mock_storage.hourly_tokens = 80.0
+    mock_storage.burst_tokens = 20.0
 
     client = TibberApiClient(
         session=mock_session,
@@ -374,6 +390,7 @@ async def test_retry_mechanism_with_exponential_backoff():
 
     client._token = "test_token"
     client._token_expiry_time = datetime.now(UTC) + timedelta(hours=1)
+    client._token_expiry_monotonic = time.monotonic() + 3600
 
     # Mock responses: fail twice, then succeed
     mock_response_fail = AsyncMock()
@@ -418,3 +435,330 @@ async def test_smart_cache_integration():
     assert "gizmos" in ttl_config
     assert "rewards_daily" in ttl_config
     assert "rewards_monthly" in ttl_config
+
+
+@pytest.mark.asyncio
+async def test_token_refreshed_proactively_before_expiry():
+    """Test a token close to expiry is returned while a refresh runs in background."""
+    client = TibberApiClient(
+        session=AsyncMock(), email="test@example.com", password="password"
+    )
+    client._token = "old_token"
+    client._token_expiry_monotonic = time.monotonic() + 12 * 60
+
+    async def fake_authenticate():
+        client._token = "new_token"
+        client._token_expiry_monotonic = time.monotonic() + 3600
+        return client._token
+
+    with patch.object(TibberApiClient, "_authenticate", side_effect=fake_authenticate):
+        assert await client._ensure_token() == "old_token"
+        assert await client._refresh_task == "new_token"
+
+    assert client._token == "new_token"
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_are_coalesced():
+    """Test identical GraphQL requests in flight share one HTTP request."""
+    client = TibberApiClient(
+        session=AsyncMock(), email="test@example.com", password="password"
+    )
+    release = asyncio.Event()
+
+    async def fake_execute(query, variables=None):
+        await release.wait()
+        return {"me": {"homes": []}}
+
+    with patch.object(
+        TibberApiClient, "_execute_graphql_request", side_effect=fake_execute
+    ) as execute:
+        first = asyncio.create_task(client._graphql_request("query", {"a": 1}))
+        second = asyncio.create_task(client._graphql_request("query", {"a": 1}))
+        other = asyncio.create_task(client._graphql_request("query", {"a": 2}))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second, other)
+
+    assert results[0] is results[1]
+    assert execute.call_count == 2
+    assert client._inflight == {}
+
+
+def test_user_agent_carries_integration_version():
+    """Test the User-Agent names the integration release when it is known."""
+    client = TibberApiClient(
+        session=AsyncMock(),
+        email="test@example.com",
+        password="password",
+        version="2025.11.1",
+    )
+    headers = client._request_headers("test_token")
+    assert headers["User-Agent"].startswith("tibber_unofficial/2025.11.1 aiohttp/")
+    assert headers["Authorization"] == "Bearer test_token"
+
+    client = TibberApiClient(session=AsyncMock(), email="test@example.com")
+    assert client._request_headers("test_token")["User-Agent"].startswith(
+        "tibber_unofficial aiohttp/"
+    )
+
+
+def test_encoded_payload_is_reused():
+    """Test GraphQL bodies are encoded once per query and variables."""
+    variables = (("homeId", "home1"),)
+
+    body = _encode_payload("query { me { id } }", variables)
+
+    assert body is _encode_payload("query { me { id } }", variables)
+    assert json.loads(body) == {
+        "query": "query { me { id } }",
+        "variables": {"homeId": "home1"},
+    }
+    assert json.loads(_encode_payload("query { me { id } }", ())) == {
+        "query": "query { me { id } }"
+    }
+
+
+def test_is_uuid():
+    """Test home IDs are validated as canonical UUID strings."""
+    assert _is_uuid("96a14971-525a-4420-aae9-e5aedaa129ff")
+    assert _is_uuid("96A14971-525A-4420-AAE9-E5AEDAA129FF")
+    assert not _is_uuid("home1")
+    assert not _is_uuid("96a14971-525a-4420-aae9-e5aedaa129fg")
+    assert not _is_uuid("96a14971-525a-4420-aae9-e5aedaa129f-")
+    assert not _is_uuid("96a14971x525a-4420-aae9-e5aedaa129ff")
+    assert not _is_uuid("96a14971-525a-4420-aae9-e5aedaa129ff\n")
+
+
+def test_token_expiry_read_from_jwt():
+    """Test token expiry comes from the JWT exp claim when present."""
+    claims = base64.urlsafe_b64encode(b'{"exp":1700000000}').rstrip(b"=").decode()
+
+    assert _token_expires_at(f"header.{claims}.signature") == 1700000000.0
+
+    with patch("time.time", return_value=1000.0):
+        assert _token_expires_at("not-a-jwt") == 4600.0
+        assert _token_expires_at("header.!!!.signature") == 4600.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_token_requests_share_one_login():
+    """Test callers needing a token while a login is in flight join it."""
+    client = TibberApiClient(
+        session=AsyncMock(), email="test@example.com", password="password"
+    )
+    release = asyncio.Event()
+
+    async def fake_authenticate():
+        await release.wait()
+        client._token = "new_token"
+        client._token_expiry_monotonic = time.monotonic() + 3600
+        return client._token
+
+    with patch.object(
+        TibberApiClient, "_authenticate", side_effect=fake_authenticate
+    ) as authenticate:
+        waiters = [asyncio.create_task(client._ensure_token()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        tokens = await asyncio.gather(*waiters)
+
+    assert tokens == ["new_token"] * 3
+    assert authenticate.call_count == 1
+    assert client._refresh_task is None
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_background_work():
+    """Test closing the client cancels work that would outlive the session."""
+    client = TibberApiClient(
+        session=AsyncMock(), email="test@example.com", password="password"
+    )
+    never = asyncio.Event()
+
+    async def never_finish(*args):
+        await never.wait()
+
+    with (
+        patch.object(TibberApiClient, "_authenticate", side_effect=never_finish),
+        patch.object(
+            TibberApiClient, "_execute_graphql_request", side_effect=never_finish
+        ),
+    ):
+        login = client._start_refresh()
+        request = asyncio.create_task(client._graphql_request("query { me { id } }"))
+        client._revalidate(never_finish(), "homes")
+        revalidation = next(iter(client._background_tasks))
+        await asyncio.sleep(0)
+        await client.async_close()
+
+    assert login.cancelled()
+    assert client._refresh_task is None
+    with pytest.raises(asyncio.CancelledError):
+        await request
+    assert client._inflight == {}
+    assert revalidation.cancelled()
+    assert client._background_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_unauthorized_request_retried_with_new_token():
+    """Test a 401 clears the token and the request is resent once."""
+    client = TibberApiClient(
+        session=AsyncMock(), email="test@example.com", password="password"
+    )
+    client._token = "old_token"
+    client._token_expiry_monotonic = time.monotonic() + 3600
+
+    async def fake_authenticate():
+        client._token = "new_token"
+        client._token_expiry_monotonic = time.monotonic() + 3600
+        return client._token
+
+    with (
+        patch.object(
+            TibberApiClient,
+            "_post_graphql",
+            side_effect=[_Unauthorized("HTTP 401"), (200, {"data": {"ok": 1}}, None)],
+        ) as post,
+        patch.object(TibberApiClient, "_authenticate", side_effect=fake_authenticate),
+    ):
+        assert await client._graphql_attempt(b"{}", 0) == {"ok": 1}
+
+    assert [call.args[0] for call in post.call_args_list] == [
+        "old_token",
+        "new_token",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("retry_after", "expected_wait"),
+    [("3600", 60.0), ("Wed, 21 Oct 2015 07:28:00 GMT", 2.0)],
+)
+async def test_rate_limited_wait_bounded_outside_semaphore(retry_after, expected_wait):
+    """Test a 429 wait is capped and does not hold a request slot."""
+    client = TibberApiClient(
+        session=AsyncMock(), email="test@example.com", password="password"
+    )
+    client._token = "test_token"
+    client._token_expiry_monotonic = time.monotonic() + 3600
+
+    async def fake_sleep(delay):
+        assert not client._request_semaphore.locked()
+
+    with (
+        patch.object(
+            TibberApiClient,
+            "_post_graphql",
+            return_value=(429, "slow down", retry_after),
+        ),
+        patch.object(TibberApiClient, "_backoff", return_value=2.0),
+        patch(
+            "custom_components.tibber_unofficial.api.sleep", side_effect=fake_sleep
+        ) as mock_sleep,
+    ):
+        await client._graphql_attempt(b"{}", 0)
+
+    mock_sleep.assert_awaited_once_with(expected_wait)
+
+
+@pytest.mark.asyncio
+async def test_cached_homes_served_on_api_error():
+    """Test last-known-good homes are returned when the API fails."""
+    homes = [{"id": "home1", "appNickname": "Home"}]
+    client = TibberApiClient(
+        session=AsyncMock(), email="test@example.com", password="password"
+    )
+    client._cache.set("get_homes", homes, ttl=0, email="test@example.com")
+    client._cache.stale_config["homes"] = 0  # Expired entries are misses
+
+    with patch.object(
+        TibberApiClient, "_graphql_request", side_effect=ApiError("Service unavailable")
+    ):
+        assert await client.async_get_homes() == homes
+
+        client._cache_fallback = False
+        with pytest.raises(ApiError):
+            await client.async_get_homes()
+
+
+@pytest.mark.asyncio
+async def test_homes_with_gizmos_fetched_in_one_request():
+    """Test homes and their gizmos come from a single request and are cached."""
+    home_id = "96a14971-525a-4420-aae9-e5aedaa129ff"
+    client = TibberApiClient(
+        session=AsyncMock(), email="test@example.com", password="password"
+    )
+    response = {
+        "me": {
+            "homes": [
+                {
+                    "id": home_id,
+                    "hasSignedEnergyDeal": True,
+                    "gizmos": [{"id": "gizmo1", "type": "BATTERY"}, {"id": "bad"}],
+                }
+            ]
+        }
+    }
+
+    with patch.object(
+        TibberApiClient, "_graphql_request", return_value=response
+    ) as request:
+        homes = await client.async_get_homes_with_gizmos()
+        gizmos = await client.async_get_gizmos(home_id)
+
+    assert homes[0]["gizmos"] == [{"id": "gizmo1", "type": "BATTERY"}]
+    assert gizmos == homes[0]["gizmos"]
+    assert request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stored_token_restored_on_initialize():
+    """Test a still-valid stored token is reused instead of logging in."""
+    token_storage = AsyncMock()
+    token_storage.async_load.return_value = (
+        "stored_token",
+        time.time() + 3000,
+        "test@example.com",
+    )
+    client = TibberApiClient(
+        session=AsyncMock(),
+        email="test@example.com",
+        password="password",
+        token_storage=token_storage,
+    )
+
+    await client.initialize()
+    assert client._token == "stored_token"
+    assert client._token_valid()
+
+    # Tokens about to expire are ignored
+    token_storage.async_load.return_value = (
+        "old_token",
+        time.time() + 60,
+        "test@example.com",
+    )
+    client = TibberApiClient(
+        session=AsyncMock(),
+        email="test@example.com",
+        password="password",
+        token_storage=token_storage,
+    )
+    await client.initialize()
+    assert client._token is None
+
+    # Tokens stored for another account are ignored
+    token_storage.async_load.return_value = (
+        "other_token",
+        time.time() + 3000,
+        "old@example.com",
+    )
+    client = TibberApiClient(
+        session=AsyncMock(),
+        email="test@example.com",
+        password="password",
+        token_storage=token_storage,
+    )
+    await client.initialize()
+    assert client._token is None
@@ -7,8 +7,8 @@ from unittest.mock import AsyncMock, Mock, patch
 import aiohttp
 import pytest
 
-from custom_components.tibber_unofficial import async_unload_entry
-from custom_components.tibber_unofficial.api import TibberApiClient
+from custom_components.tibber_unofficial import async_setup_entry, async_unload_entry
+from custom_components.tibber_unofficial.api import ApiError, TibberApiClient
 from custom_components.tibber_unofficial.cache import SmartCache
 from custom_components.tibber_unofficial.rate_limiter import MultiTierRateLimiter
 
@@ -49,7 +49,8 @@ async def mock_storage():
     """Mock rate limiter storage."""
     storage = AsyncMock()
     storage.async_load = AsyncMock(return_value={})
-    storage.get_tokens = Mock(return_value=(80.0, 20.0))
+    storage.hourly_tokens = 80.0
+    storage.burst_tokens = 20.0
     return storage
 
 
@@ -108,6 +109,69 @@ class TestSessionCleanup:
         assert result is True
         mock_session.close.assert_called_once()
 
+    async def test_session_closed_when_setup_fails(self, mock_hass, mock_config_entry):
+        """Test a failed setup closes and forgets its dedicated session."""
+        session = AsyncMock()
+        with (
+            patch(
+                "custom_components.tibber_unofficial.TibberApiClient"
+            ) as mock_api_class,
+            patch("custom_components.tibber_unofficial.RateLimiterStorage"),
+            patch("custom_components.tibber_unofficial.async_get_integration"),
+            patch("custom_components.tibber_unofficial.TokenStorage"),
+        ):
+            mock_api_class.build_session.return_value = session
+            api_client = mock_api_class.return_value
+            api_client.initialize = AsyncMock(side_effect=ApiError("Network error"))
+            api_client.async_close = AsyncMock()
+
+            with pytest.raises(ApiError):
+                await async_setup_entry(mock_hass, mock_config_entry)
+
+        api_client.async_close.assert_awaited_once()
+        session.close.assert_awaited_once()
+        assert mock_config_entry.entry_id not in mock_hass.data[
+            "tibber_unofficial"
+        ].get("sessions", {})
+
+    async def test_config_flow_token_moved_to_token_storage(
+        self, mock_hass, mock_config_entry
+    ):
+        """Test the config flow's token leaves the entry data on setup."""
+        mock_config_entry.data = {
+            **mock_config_entry.data,
+            "token": "flow_token",
+            "token_expires_at": 2000000000.0,
+        }
+        with (
+            patch(
+                "custom_components.tibber_unofficial.TibberApiClient"
+            ) as mock_api_class,
+            patch("custom_components.tibber_unofficial.RateLimiterStorage"),
+            patch("custom_components.tibber_unofficial.async_get_integration"),
+            patch(
+                "custom_components.tibber_unofficial.TokenStorage"
+            ) as mock_token_storage_class,
+        ):
+            mock_api_class.build_session.return_value = AsyncMock()
+            mock_api_class.return_value.initialize = AsyncMock(
+                side_effect=ApiError("Network error")
+            )
+            mock_api_class.return_value.async_close = AsyncMock()
+            token_storage = mock_token_storage_class.return_value
+            token_storage.async_save = AsyncMock()
+
+            with pytest.raises(ApiError):
+                await async_setup_entry(mock_hass, mock_config_entry)
+
+        token_storage.async_save.assert_awaited_once_with(
+            "flow_token", 2000000000.0, "test@example.com"
+        )
+        new_data = mock_hass.config_entries.async_update_entry.call_args.kwargs["data"]
+        assert "token" not in new_data
+        assert "token_expires_at" not in new_data
+        assert new_data["home_id"] == mock_config_entry.data["home_id"]
+
 
 class TestCacheTaskLeak:
     """Test cache stats task memory leak fixes."""
@@ -212,22 +276,23 @@ class TestTimezoneHandling:
 class TestCacheKeyCollision:
     """Test cache key collision fixes."""
 
-    def test_sha256_hash_used_for_cache_keys(self):
-        """Test cache uses SHA256 instead of MD5 for keys."""
+    def test_cache_keys_are_deterministic(self):
+        """Test cache keys depend only on method and arguments."""
         cache = SmartCache()
 
         # Test key generation
         key1 = cache._make_key("method1", param1="value1", param2="value2")
-        key2 = cache._make_key("method1", param1="value1", param2="value2")
+        key2 = cache._make_key("method1", param2="value2", param1="value1")
         key3 = cache._make_key("method1", param1="value1", param2="different")
 
-        # Same parameters should generate same key
+        # Same parameters should generate same key, regardless of order
         assert key1 == key2
         # Different parameters should generate different keys
         assert key1 != key3
-        # Keys should be 64 characters (SHA256 hex)
-        assert len(key1) == 64
-        assert all(c in "0123456789abcdef" for c in key1)
+        # Values are quoted so separators inside them cannot collide
+        assert cache._make_key("m", a="x|b='y'") != cache._make_key("m", a="x", b="y")
+        # Unhashable values fall back to JSON
+        assert cache._make_key("m", a={"x": 1}) == cache._make_key("m", a={"x": 1})
 
     def test_cache_key_collision_resistance(self):
         """Test cache keys have low collision probability."""
@@ -334,7 +399,8 @@ class TestRateLimiterPersistence:
         """Test rate limiter saves state periodically."""
         mock_storage = AsyncMock()
         mock_storage.async_load.return_value = {}
-        mock_storage.get_tokens.return_value = (80.0, 20.0)
+        mock_storage.hourly_tokens = 80.0
+        mock_storage.burst_tokens = 20.0
         mock_storage.async_save = AsyncMock()
 
         rate_limiter = MultiTierRateLimiter(storage=mock_storage)
@@ -358,7 +424,8 @@ class TestRateLimiterPersistence:
             "hourly_tokens": 40.0,
             "burst_tokens": 10.0,
         }
-        mock_storage.get_tokens.return_value = (40.0, 10.0)
+        mock_storage.hourly_tokens = 40.0
+        mock_storage.burst_tokens = 10.0
 
         rate_limiter = MultiTierRateLimiter(storage=mock_storage)
         await rate_limiter.initialize()
@@ -367,6 +434,86 @@ class TestRateLimiterPersistence:
         assert rate_limiter.hourly.tokens == 40.0
         assert rate_limiter.burst.tokens == 10.0
 
+    async def test_rate_limiter_save_is_deferred(self):
+        """Test acquire schedules a delayed save instead of writing inline."""
+        mock_storage = Mock()
+        rate_limiter = MultiTierRateLimiter(storage=mock_storage)
+
+        await rate_limiter.acquire()
+
+        tokens_func, delay = mock_storage.async_delay_save.call_args.args
+        assert delay == 60
+        assert tokens_func() == (
+            rate_limiter.hourly.tokens,
+            rate_limiter.burst.tokens,
+        )
+
+    async def test_rate_limiter_takes_tokens_only_when_all_tiers_allow(self):
+        """Test a waiting caller does not spend an hourly token early."""
+        rate_limiter = MultiTierRateLimiter()
+        rate_limiter.hourly.tokens = 5.0
+        rate_limiter.burst.tokens = 0.0
+
+        with (
+            patch("asyncio.sleep", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await rate_limiter.acquire()
+
+        assert rate_limiter.hourly.tokens == pytest.approx(5.0, abs=0.01)
+
+    async def test_rate_limiter_idle_bucket_holds_at_most_capacity(self):
+        """Test an idle bucket grants no more than its burst before waiting."""
+        with patch("time.monotonic", return_value=1000.0):
+            rate_limiter = MultiTierRateLimiter()
+
+        granted = 0
+        with (
+            patch("time.monotonic", return_value=1000.0 + 7200),
+            patch("asyncio.sleep") as sleep,
+        ):
+            while not sleep.await_count:
+                await rate_limiter.acquire()
+                granted += 1
+
+        # The call that had to wait is granted too, after its sleep
+        assert granted - 1 == rate_limiter.burst.calls
+        assert rate_limiter.hourly.tokens <= rate_limiter.hourly.calls
+
+    async def test_rate_limiter_sleeps_once_until_token_is_due(self):
+        """Test a limited caller sleeps exactly once, for the computed wait."""
+        rate_limiter = MultiTierRateLimiter()
+        rate_limiter.burst.tokens = 0.5
+
+        with (
+            patch("time.monotonic", return_value=1000.0),
+            patch("asyncio.sleep") as sleep,
+        ):
+            rate_limiter.burst.last_update = 1000.0
+            rate_limiter.hourly.last_update = 1000.0
+            await rate_limiter.acquire()
+
+        # Half a token at 20 per 900 seconds
+        sleep.assert_awaited_once_with(pytest.approx(22.5))
+        assert rate_limiter.burst.tokens == pytest.approx(0.0)
+        assert rate_limiter.burst.last_update == pytest.approx(1022.5)
+
+    def test_rate_limiter_follows_response_headers(self):
+        """Test server-reported quota and Retry-After throttle the hourly tier."""
+        rate_limiter = MultiTierRateLimiter()
+
+        rate_limiter.update_from_headers({"X-RateLimit-Remaining": "3"})
+        assert rate_limiter.hourly.tokens == 3.0
+
+        rate_limiter.update_from_headers({"X-RateLimit-Remaining": "50"})
+        assert rate_limiter.hourly.tokens == 3.0
+
+        with patch("time.monotonic", return_value=1000.0):
+            rate_limiter.update_from_headers({"Retry-After": "30"})
+            assert rate_limiter.hourly.tokens == 0.0
+            # The pause plus the time to accrue one token (45s at 80/hour)
+            assert rate_limiter.hourly._refill(1000.0) == pytest.approx(75.0)
+
 
 @pytest.mark.skip(reason="Tests function that was removed/refactored")
 class TestOptionsUpdateRaceCondition:
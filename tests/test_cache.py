@@ -155,7 +155,7 @@ def test_smart_cache_ttl_selection():
     gizmos_key = cache._make_key("get_gizmos", home="123")
     rewards_key = cache._make_key("get_rewards", date="2024-01-01")
 
-    # Cache entries are now 4-tuples: (data, expiry_time, cached_at, method)
+    # Cache entries are 3-tuples: (data, expiry_time, method)
     homes_expiry = entries[homes_key][1]
     gizmos_expiry = entries[gizmos_key][1]
     rewards_expiry = entries[rewards_key][1]
@@ -165,21 +165,22 @@ def test_smart_cache_ttl_selection():
     assert gizmos_expiry > rewards_expiry
 
 
-@patch("custom_components.tibber_unofficial.cache.datetime")
-def test_smart_cache_adaptive_ttl(mock_datetime):
+def test_smart_cache_adaptive_ttl():
     """Test SmartCache adaptive TTL based on time."""
     cache = SmartCache()
 
     # Test near end of day - should get shorter TTL
     mock_now = datetime(2024, 1, 15, 23, 0, 0, tzinfo=UTC)  # 11 PM UTC
-    mock_datetime.now.return_value = mock_now
-
-    cache.set_smart("get_rewards", {"rewards": 100}, "rewards_daily")
+    with (
+        patch("time.gmtime", return_value=mock_now.utctimetuple()),
+        patch("time.time", return_value=1000.0),
+    ):
+        cache.set_smart("get_rewards", {"rewards": 100}, "rewards_daily")
 
     # Check TTL is shortened
     key = list(cache._cache.keys())[0]
-    _, expiry, cached_at, _ = cache._cache[key]
-    ttl = expiry - cached_at
+    _, expiry, _ = cache._cache[key]
+    ttl = expiry - 1000.0
 
     assert ttl == 60  # Should be 1 minute near midnight
 
@@ -193,3 +194,43 @@ def test_cache_key_consistency():
     # Should hit regardless of argument order
     assert cache.get("method", arg3="c", arg1="a", arg2="b") == "data"
     assert cache.get("method", arg2="b", arg3="c", arg1="a") == "data"
+
+
+def test_cache_get_with_status():
+    """Test cache freshness status for stale-while-revalidate."""
+    cache = ApiCache(default_ttl=1)
+    cache.set("test_method", "data", arg="value")
+
+    assert cache.get_with_status("test_method", 10, arg="value") == ("data", "fresh")
+
+    # Expired but within the stale window
+    with patch("time.time", return_value=time.time() + 5):
+        assert cache.get_with_status("test_method", 10, arg="value") == (
+            "data",
+            "stale",
+        )
+
+    # Past the stale window it is a miss, but kept as a fallback
+    with patch("time.time", return_value=time.time() + 20):
+        assert cache.get_with_status("test_method", 10, arg="value") == (
+            None,
+            "miss",
+        )
+        assert cache.get_stale("test_method", arg="value") == "data"
+    assert cache.get_stale("test_method", arg="other") is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the cache stays bounded by evicting the least recently used entry."""
+    cache = ApiCache(default_ttl=60, max_size=2)
+    cache.set("first", "data1")
+    cache.set("second", "data2")
+
+    # Touch the first entry so the second becomes least recently used
+    assert cache.get("first") == "data1"
+    cache.set("third", "data3")
+
+    assert len(cache._cache) == 2
+    assert cache.get("first") == "data1"
+    assert cache.get("second") is None
+    assert cache.get("third") == "data3"
@@ -120,17 +120,17 @@ async def test_home_selection(mock_hass):
     ) as mock_client:
         instance = mock_client.return_value
         instance.authenticate = AsyncMock(return_value="test_token")
-        instance.async_get_homes = AsyncMock(
+        instance.async_get_homes_with_gizmos = AsyncMock(
             return_value=[
                 {
                     "id": "home1",
                     "appNickname": "My Home",
                     "address": {"address1": "123 Test St"},
                     "hasSignedEnergyDeal": True,
+                    "gizmos": [],
                 }
             ]
         )
-        instance.async_get_gizmos = AsyncMock(return_value=[])
 
         # Start flow
         result = await mock_hass.config_entries.flow.async_init(
@@ -164,17 +164,17 @@ async def test_already_configured(mock_hass, mock_config_entry):
     ) as mock_client:
         instance = mock_client.return_value
         instance.authenticate = AsyncMock(return_value="test_token")
-        instance.async_get_homes = AsyncMock(
+        instance.async_get_homes_with_gizmos = AsyncMock(
             return_value=[
                 {
                     "id": "96a14971-525a-4420-aae9-e5aedaa129ff",
                     "appNickname": "My Home",
                     "address": {"address1": "123 Test St"},
                     "hasSignedEnergyDeal": True,
+                    "gizmos": [],
                 }
             ]
         )
-        instance.async_get_gizmos = AsyncMock(return_value=[])
 
         result = await mock_hass.config_entries.flow.async_init(
             DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -219,3 +219,105 @@ async def test_coordinator_update_intervals(mock_hass, mock_config_entry):
     # Check update intervals
     assert grid_coordinator.update_interval == timedelta(minutes=15)
     assert gizmo_coordinator.update_interval == timedelta(hours=12)
+
+
+@pytest.mark.asyncio
+async def test_closed_period_rewards_are_reused(
+    mock_hass, mock_config_entry, mock_api_client
+):
+    """Test rewards for closed windows are only fetched once."""
+    coordinator = GridRewardsCoordinator(
+        mock_hass, mock_api_client, mock_config_entry.data["home_id"]
+    )
+    january = ("2024-01-01T00:00:00+00:00", "2024-02-01T00:00:00+00:00")
+
+    first = await coordinator._fetch_reward_data_for_period(
+        "Previous Month", *january, window_closed=True
+    )
+    second = await coordinator._fetch_reward_data_for_period(
+        "Previous Month", *january, window_closed=True
+    )
+    assert first == second
+    assert mock_api_client.async_get_grid_rewards_history.await_count == 1
+
+    # A different window is fetched separately
+    await coordinator._fetch_reward_data_for_period(
+        "Previous Month",
+        "2024-02-01T00:00:00+00:00",
+        "2024-03-01T00:00:00+00:00",
+        window_closed=True,
+    )
+    assert mock_api_client.async_get_grid_rewards_history.await_count == 2
+
+    # Windows that are not marked closed are always fetched
+    await coordinator._fetch_reward_data_for_period("Year", *january)
+    await coordinator._fetch_reward_data_for_period("Year", *january)
+    assert mock_api_client.async_get_grid_rewards_history.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_period_fetch_propagates_auth_errors(mock_hass, mock_config_entry):
+    """Test auth errors are not swallowed into an empty period result."""
+    from custom_components.tibber_unofficial.api import ApiAuthError, ApiError
+
+    mock_api = AsyncMock()
+    mock_api.async_get_grid_rewards_history = AsyncMock(
+        side_effect=ApiError("Network error")
+    )
+    coordinator = GridRewardsCoordinator(
+        mock_hass, mock_api, mock_config_entry.data["home_id"]
+    )
+    period = ("2024-01-01T00:00:00+00:00", "2024-02-01T00:00:00+00:00")
+
+    data = await coordinator._fetch_reward_data_for_period("Year", *period)
+    assert data["total"] is None
+
+    mock_api.async_get_grid_rewards_history.side_effect = ApiAuthError("401")
+    with pytest.raises(ApiAuthError):
+        await coordinator._fetch_reward_data_for_period("Year", *period)
+
+
+@pytest.mark.asyncio
+async def test_gizmo_coordinator_reuses_unchanged_result(mock_hass, mock_config_entry):
+    """Test unchanged gizmo lists return the previously grouped result."""
+    mock_api = AsyncMock()
+    mock_api.async_get_gizmos = AsyncMock(
+        return_value=[{"type": "ELECTRIC_VEHICLE", "id": "gizmo1"}]
+    )
+
+    coordinator = GizmoUpdateCoordinator(
+        mock_hass, mock_api, mock_config_entry.data["home_id"], {}
+    )
+
+    first = await coordinator._async_update_data()
+    second = await coordinator._async_update_data()
+    assert first == {"ELECTRIC_VEHICLE": ["gizmo1"]}
+    assert second is first
+
+    mock_api.async_get_gizmos.return_value = [
+        {"type": "ELECTRIC_VEHICLE", "id": "gizmo1"},
+        {"type": "BATTERY", "id": "gizmo2"},
+    ]
+    third = await coordinator._async_update_data()
+    assert third == {"ELECTRIC_VEHICLE": ["gizmo1"], "BATTERY": ["gizmo2"]}
+
+
+@pytest.mark.asyncio
+async def test_gizmo_coordinator_seeded_from_initial_gizmos(
+    mock_hass, mock_config_entry
+):
+    """Test gizmos stored in the config entry seed the coordinator data."""
+    mock_api = AsyncMock()
+
+    seeded = GizmoUpdateCoordinator(
+        mock_hass,
+        mock_api,
+        mock_config_entry.data["home_id"],
+        {"ELECTRIC_VEHICLE": ["gizmo1"]},
+    )
+    empty = GizmoUpdateCoordinator(
+        mock_hass, mock_api, mock_config_entry.data["home_id"], {}
+    )
+
+    assert seeded.data == {"ELECTRIC_VEHICLE": ["gizmo1"]}
+    assert empty.data is None
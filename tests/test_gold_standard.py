@@ -156,7 +156,9 @@ class TestDiagnostics:
 
         # Mock registries
         mock_entity_registry = Mock()
-        mock_entity_registry.async_entries_for_device = Mock(return_value=[])
+        mock_hass.helpers.entity_registry.async_entries_for_device = Mock(
+            return_value=[]
+        )
         mock_hass.helpers.entity_registry.async_get = Mock(
             return_value=mock_entity_registry
         )
@@ -176,7 +178,7 @@ class TestDiagnostics:
 
         # Mock config entry diagnostics
         with patch(
-            "custom_components.tibber_unofficial.diagnostics.async_get_config_entry_diagnostics"
+            "custom_components.tibber_unofficial.diagnostics._collect_diagnostics"
         ) as mock_get_config:
             mock_get_config.return_value = {
                 "devices": [
@@ -196,6 +198,14 @@ class TestDiagnostics:
             assert "device" in diagnostics
             assert "entities" in diagnostics
             assert "system_info" in diagnostics
+            assert diagnostics["device"]["name"] == "Test Device"
+            mock_get_config.assert_awaited_once_with(
+                mock_hass,
+                mock_config_entry,
+                mock_entity_registry,
+                mock_device_registry,
+                entity_ids=set(),
+            )
 
 
 class TestRepairs:
@@ -334,9 +344,11 @@ class TestServices:
         mock_cache = Mock()
         mock_cache.invalidate = Mock()
         mock_api_client._cache = mock_cache
+        mock_coordinator = Mock()
 
         mock_hass.data["tibber_unofficial"]["test_entry"] = {
-            "api_client": mock_api_client
+            "api_client": mock_api_client,
+            "rewards_coordinator": mock_coordinator,
         }
 
         # Setup services
@@ -358,8 +370,9 @@ class TestServices:
         # Call service
         await clear_cache_service(mock_call)
 
-        # Verify cache was cleared
+        # Verify cache and stored closed-window rewards were cleared
         mock_cache.invalidate.assert_called_once()
+        mock_coordinator.async_clear_period_cache.assert_called_once()
 
 
 @pytest.mark.gold_standard